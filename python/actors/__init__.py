@@ -6,7 +6,7 @@ THIS SOFTWARE IS OPEN SOURCE UNDER THE MIT LICENSE
 Copyright 2025 Vincent Maciejewski, & M2 Tech
 """
 
-from .actor import Actor, ActorRef, LocalActorRef, Envelope
+from .actor import Actor, ActorRef, LocalActorRef, Envelope, FastMailbox
 from .manager import Manager, ManagerHandle
 from .messages import Start, Shutdown, Reject
 from .remote import RemoteActorRef, ZmqSender, ZmqReceiver
@@ -25,6 +25,7 @@ __all__ = [
     'ActorRef',
     'LocalActorRef',
     'Envelope',
+    'FastMailbox',
     'Manager',
     'ManagerHandle',
     'Start',
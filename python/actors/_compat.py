@@ -0,0 +1,12 @@
+"""
+Python version compatibility helpers.
+
+THIS SOFTWARE IS OPEN SOURCE UNDER THE MIT LICENSE
+Copyright 2025 Vincent Maciejewski, & M2 Tech
+"""
+
+import sys
+
+# dataclass(slots=True) needs Python 3.10+; on 3.9 classes keep a __dict__.
+# Usage: @dataclass(**DATACLASS_SLOTS)
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
@@ -6,14 +6,20 @@ THIS SOFTWARE IS OPEN SOURCE UNDER THE MIT LICENSE
 Copyright 2025 Vincent Maciejewski, & M2 Tech
 """
 
+import inspect
+import os
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
 from queue import Queue, Empty
-from threading import Thread
-from typing import Any, Optional
+from threading import Event, Thread, local
+from types import FunctionType
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+from ._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class Envelope:
     """Message wrapper with sender info for replies."""
     msg: Any
@@ -21,6 +27,90 @@ class Envelope:
     reply_queue: Optional[Queue] = field(default=None, repr=False)
 
 
+# Opt-in Envelope recycling, enabled with ACTORS_ENVELOPE_POOL=1. Only
+# envelopes without a sender or reply queue are recycled, and only once the
+# handler has returned, so handlers must not keep a reference to the
+# envelope itself. list.append/pop are atomic under the GIL, so one shared
+# free list serves producer and consumer threads alike.
+ENVELOPE_POOL_ENABLED = os.environ.get('ACTORS_ENVELOPE_POOL') == '1'
+ENVELOPE_POOL_SIZE = 1024
+_envelope_pool: List[Envelope] = []
+
+
+def _acquire_envelope(msg: Any, sender: Optional['ActorRef']) -> Envelope:
+    """Take an Envelope from the pool, or allocate one if it is empty."""
+    if ENVELOPE_POOL_ENABLED and sender is None:
+        try:
+            envelope = _envelope_pool.pop()
+        except IndexError:
+            pass
+        else:
+            envelope.msg = msg
+            return envelope
+    return Envelope(msg, sender)
+
+
+def _recycle_envelope(envelope: Envelope) -> None:
+    """Return a processed Envelope to the pool if nothing else can hold it."""
+    if (envelope.sender is None and envelope.reply_queue is None
+            and len(_envelope_pool) < ENVELOPE_POOL_SIZE):
+        envelope.msg = None
+        _envelope_pool.append(envelope)
+
+
+class FastMailbox:
+    """Unbounded actor mailbox: a deque plus a wakeup Event.
+
+    Implements the subset of the Queue API that actors use (put, get,
+    get_nowait, empty, qsize). deque.append/popleft are atomic under the
+    GIL, so producers take no lock and only signal the Event when the
+    consumer may be waiting. Intended for a single consumer thread.
+    """
+
+    __slots__ = ('_deque', '_event')
+
+    def __init__(self):
+        self._deque = deque()
+        self._event = Event()
+
+    def put(self, item: Any) -> None:
+        """Append an item and wake the consumer."""
+        self._deque.append(item)
+        # Skip the Event's internal lock when a wakeup is already pending
+        if not self._event.is_set():
+            self._event.set()
+
+    put_nowait = put
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """Remove and return the oldest item, raising Empty on timeout."""
+        items = self._deque
+        event = self._event
+        while True:
+            try:
+                return items.popleft()
+            except IndexError:
+                pass
+            if not block:
+                raise Empty
+            event.clear()
+            # An item appended before clear() may have lost its wakeup
+            if items:
+                continue
+            if not event.wait(timeout):
+                raise Empty
+
+    def get_nowait(self) -> Any:
+        """Remove and return the oldest item, raising Empty if there is none."""
+        return self.get(block=False)
+
+    def empty(self) -> bool:
+        return not self._deque
+
+    def qsize(self) -> int:
+        return len(self._deque)
+
+
 class ActorRef(ABC):
     """Base class for actor references (mailbox addresses)."""
 
@@ -41,10 +131,15 @@ class ActorRef(ABC):
         pass
 
 
+# Reply queue reused by fast_send. A call blocks until its reply arrives,
+# so a thread never has two calls outstanding on the same queue.
+_fast_send_local = local()
+
+
 class LocalActorRef(ActorRef):
-    """ActorRef for actors in the same process - uses Queue."""
+    """ActorRef for actors in the same process - uses a mailbox queue."""
 
-    def __init__(self, queue: Queue, name: str):
+    def __init__(self, queue: Union[Queue, FastMailbox], name: str):
         self._queue = queue
         self._name = name
 
@@ -54,11 +149,15 @@ class LocalActorRef(ActorRef):
 
     def send(self, msg: Any, sender: Optional[ActorRef] = None) -> None:
         """Send a message asynchronously."""
-        self._queue.put(Envelope(msg, sender))
+        self._queue.put(_acquire_envelope(msg, sender))
 
     def fast_send(self, msg: Any, sender: Optional[ActorRef] = None) -> Any:
         """Send a message and wait for reply."""
-        reply_queue = Queue()
+        reply_queue = getattr(_fast_send_local, 'reply_queue', None)
+        if reply_queue is None or not reply_queue.empty():
+            # A handler that replied twice left a stray reply behind;
+            # start over so it cannot answer this call
+            reply_queue = _fast_send_local.reply_queue = Queue()
         self._queue.put(Envelope(msg, sender, reply_queue))
         return reply_queue.get()
 
@@ -66,10 +165,19 @@ class LocalActorRef(ActorRef):
 class Actor:
     """Base class for all actors."""
 
+    # Per-class cache of message type -> (handler name, plain function
+    # defined on the class or None), filled on first dispatch so each type
+    # builds its handler name and walks the MRO only once
+    _handlers: Dict[type, Tuple[str, Optional[Callable]]] = {}
+
     _actor_ref: Optional[LocalActorRef] = None
-    _queue: Optional[Queue] = None
+    _queue: Optional[FastMailbox] = None
     _running: bool = True
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._handlers = {}
+
     def init(self) -> None:
         """Called once when actor starts, before processing messages."""
         pass
@@ -85,17 +193,38 @@ class Actor:
             try:
                 envelope = self._queue.get(timeout=0.1)
                 self.process_message(envelope)
+                if ENVELOPE_POOL_ENABLED:
+                    _recycle_envelope(envelope)
             except Empty:
                 pass
         self.end()
 
     def process_message(self, envelope: Envelope) -> None:
         """Dispatch to on_<classname> handler via reflection."""
-        handler_name = f"on_{type(envelope.msg).__name__.lower()}"
-        handler = getattr(self, handler_name, None)
+        msg_type = type(envelope.msg)
+        try:
+            name, func = self._handlers[msg_type]
+        except KeyError:
+            name, func = self._resolve_handler(msg_type)
+        if func is not None and name not in self.__dict__:
+            func(self, envelope)
+            return
+        # Handlers assigned on the instance, staticmethods and other
+        # descriptors are looked up on every message
+        handler = getattr(self, name, None)
         if handler:
             handler(envelope)
 
+    @classmethod
+    def _resolve_handler(cls, msg_type: type) -> Tuple[str, Optional[Callable]]:
+        """Look up and cache the on_<classname> handler for a message type."""
+        name = f"on_{msg_type.__name__.lower()}"
+        func = inspect.getattr_static(cls, name, None)
+        if not isinstance(func, FunctionType):
+            func = None
+        cls._handlers[msg_type] = (name, func)
+        return name, func
+
     def reply(self, envelope: Envelope, response: Any) -> None:
         """Reply to a message - works for both local and remote."""
         if envelope.reply_queue:
@@ -6,12 +6,10 @@ THIS SOFTWARE IS OPEN SOURCE UNDER THE MIT LICENSE
 Copyright 2025 Vincent Maciejewski, & M2 Tech
 """
 
-import time
-from queue import Queue
-from threading import Thread
+from threading import Event, Thread
 from typing import Dict, Optional
 
-from .actor import Actor, LocalActorRef
+from .actor import Actor, FastMailbox, LocalActorRef
 from .messages import Start, Shutdown
 
 
@@ -19,15 +17,19 @@ class ManagerHandle:
     """Handle for actors to signal termination."""
 
     def __init__(self):
-        self._terminated = False
+        self._terminated = Event()
 
     def terminate(self) -> None:
         """Signal the manager to terminate."""
-        self._terminated = True
+        self._terminated.set()
 
     def is_terminated(self) -> bool:
         """Check if termination was signaled."""
-        return self._terminated
+        return self._terminated.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until termination is signaled; returns False on timeout."""
+        return self._terminated.wait(timeout)
 
 
 class Manager:
@@ -49,7 +51,7 @@ class Manager:
 
     def manage(self, name: str, actor: Actor) -> LocalActorRef:
         """Register an actor, returns its LocalActorRef."""
-        queue = Queue()
+        queue = FastMailbox()
         actor_ref = LocalActorRef(queue, name)
         actor._actor_ref = actor_ref
         actor._queue = queue
@@ -73,8 +75,11 @@ class Manager:
 
     def run(self) -> None:
         """Wait until terminated."""
-        while not self._handle.is_terminated():
-            time.sleep(0.1)
+        # Wakes as soon as terminate() is called. The timeout only bounds each
+        # wait so Ctrl-C is still delivered on platforms where a blocking
+        # wait cannot be interrupted.
+        while not self._handle.wait(1.0):
+            pass
 
     def end(self) -> None:
         """Stop all actors and wait for threads."""
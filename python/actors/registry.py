@@ -5,37 +5,51 @@ THIS SOFTWARE IS OPEN SOURCE UNDER THE MIT LICENSE
 Copyright 2025 Vincent Maciejewski, & M2 Tech
 """
 
+import heapq
 import json
 import subprocess
+import sys
 import threading
 import time
-from dataclasses import dataclass, field
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 import logging
 
 from actors import Actor, Manager, LocalActorRef
+from . import wire
+from ._compat import DATACLASS_SLOTS
 from .registry_messages import (
     RegisterActor, UnregisterActor, RegistrationOk, RegistrationFailed,
-    LookupActor, LookupResult, Heartbeat, HeartbeatAck,
+    LookupActor, LookupResult, LookupManyActors, LookupManyResult,
+    Heartbeat, BatchHeartbeat, HeartbeatAck, HEARTBEAT_ACK, HEARTBEAT_ACK_BYTES,
     StartManager, StopManager, RestartManager, ManagerStatus
 )
 
 logger = logging.getLogger(__name__)
 
+try:
+    # orjson parses large configs several times faster; it is optional
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ActorEntry:
-    """Registry entry for an actor."""
+    """Registry entry for an actor (slotted; one is kept per registered actor)."""
     endpoint: str
     manager_id: str
 
 
-@dataclass
-class HostConfig:
-    """Configuration for a remote host."""
-    ssh: str  # e.g., "user@192.168.1.10"
-    managers: Dict[str, dict] = field(default_factory=dict)
+class SystemctlDone:
+    """Posted to the registry's own mailbox when an SSH command finishes."""
+    __slots__ = ('status', 'ctx')
+
+    def __init__(self, status: ManagerStatus, ctx):
+        self.status = status
+        self.ctx = ctx
 
 
 class GlobalRegistry(Actor):
@@ -57,30 +71,64 @@ class GlobalRegistry(Actor):
     """
 
     HEARTBEAT_TIMEOUT_S = 6.0  # 3 missed heartbeats (2s each)
-    HEARTBEAT_CHECK_INTERVAL_S = 1.0
+    SSH_WORKERS = 8
+
+    # Reuse one SSH connection per host: the first command opens a control
+    # master, later commands multiplex over it instead of a new handshake
+    SSH_OPTIONS = (
+        "-o", "ControlMaster=auto",
+        "-o", "ControlPath=/tmp/ssh-actors-%r@%h:%p",
+        "-o", "ControlPersist=60s",
+    )
 
     def __init__(self, config_path: Optional[str] = None):
         super().__init__()
 
+        # Guards _registry, _heartbeats, _hb_heap and _manager_actors, which
+        # are shared between request handling and the heartbeat monitor.
+        # Reentrant because _check_heartbeats calls _unregister_manager.
+        self._state_lock = threading.RLock()
+
+        # The heartbeat monitor sleeps on this until the next deadline
+        self._state_cv = threading.Condition(self._state_lock)
+
         # actor_name -> ActorEntry
         self._registry: Dict[str, ActorEntry] = {}
 
         # manager_id -> last_heartbeat_time (monotonic)
         self._heartbeats: Dict[str, float] = {}
 
+        # Min-heap of (heartbeat_time, manager_id). Superseded entries are
+        # left in place and skipped when popped (lazy deletion).
+        self._hb_heap: List[Tuple[float, str]] = []
+
         # manager_id -> set of actor_names
         self._manager_actors: Dict[str, Set[str]] = {}
 
-        # Host configuration for SSH control
-        self._hosts: Dict[str, HostConfig] = {}
+        # Snapshots returned by get_all_actors/get_all_managers; reset to
+        # None whenever actors or managers are added or removed
+        self._actor_names_cache: Optional[Tuple[str, ...]] = None
+        self._manager_ids_cache: Optional[Tuple[str, ...]] = None
+
+        # Host configuration for SSH control, as parallel lists indexed by
+        # host number: host_ids[i] is reached via ssh target host_ssh[i]
+        self._host_ids: List[str] = []
+        self._host_ssh: List[str] = []
 
-        # manager_id -> host_id mapping
-        self._manager_to_host: Dict[str, str] = {}
+        # manager_id -> host number, and manager_id -> systemd service name
+        self._manager_host: Dict[str, int] = {}
+        self._manager_service: Dict[str, str] = {}
 
         # Load config if provided
         if config_path:
             self._load_config(config_path)
 
+        # SSH commands take seconds; run them off the actor thread
+        self._ssh_pool = ThreadPoolExecutor(
+            max_workers=self.SSH_WORKERS,
+            thread_name_prefix="ssh"
+        )
+
         # Background thread for heartbeat monitoring
         self._monitor_thread: Optional[threading.Thread] = None
         self._running = False
@@ -92,19 +140,18 @@ class GlobalRegistry(Actor):
             logger.warning(f"Config file not found: {config_path}")
             return
 
-        with open(path) as f:
-            config = json.load(f)
+        config = _json_loads(path.read_bytes())
 
         for host_id, host_data in config.get("hosts", {}).items():
-            self._hosts[host_id] = HostConfig(
-                ssh=host_data.get("ssh", ""),
-                managers=host_data.get("managers", {})
-            )
-            # Build manager -> host mapping
-            for manager_id in host_data.get("managers", {}).keys():
-                self._manager_to_host[manager_id] = host_id
+            host_index = len(self._host_ids)
+            self._host_ids.append(host_id)
+            self._host_ssh.append(host_data.get("ssh", ""))
+            # Build manager -> host and manager -> service mappings
+            for manager_id, manager_config in host_data.get("managers", {}).items():
+                self._manager_host[manager_id] = host_index
+                self._manager_service[manager_id] = manager_config.get("service", manager_id)
 
-        logger.info(f"Loaded config with {len(self._hosts)} hosts")
+        logger.info(f"Loaded config with {len(self._host_ids)} hosts")
 
     def init(self) -> None:
         """Start heartbeat monitoring thread."""
@@ -119,165 +166,206 @@ class GlobalRegistry(Actor):
 
     def end(self) -> None:
         """Stop heartbeat monitoring."""
-        self._running = False
+        with self._state_cv:
+            self._running = False
+            self._state_cv.notify()
         if self._monitor_thread:
             self._monitor_thread.join(timeout=2.0)
+        self._ssh_pool.shutdown(wait=False)
         logger.info("GlobalRegistry stopped")
 
     def _heartbeat_monitor(self) -> None:
-        """Background thread to check for stale heartbeats."""
-        while self._running:
-            time.sleep(self.HEARTBEAT_CHECK_INTERVAL_S)
-            self._check_heartbeats()
+        """Background thread to check for stale heartbeats.
+
+        Sleeps until the oldest live heartbeat would expire, or indefinitely
+        while no manager is tracked, instead of polling on a fixed interval.
+        """
+        with self._state_cv:
+            while self._running:
+                self._check_heartbeats()
+                if self._hb_heap:
+                    timeout = max(
+                        0.0,
+                        self._hb_heap[0][0] + self.HEARTBEAT_TIMEOUT_S - time.monotonic()
+                    )
+                else:
+                    timeout = None
+                self._state_cv.wait(timeout)
+
+    def _record_heartbeat(self, manager_id: str, now: float) -> None:
+        """Record a heartbeat time for a manager."""
+        # Interned so the same manager_id object is shared by the heartbeat
+        # dict, the heap and _manager_actors, and key compares hit identity
+        manager_id = sys.intern(manager_id)
+        with self._state_lock:
+            self._heartbeats[manager_id] = now
+            heapq.heappush(self._hb_heap, (now, manager_id))
+            # A new heartbeat only moves the next deadline if the monitor
+            # had nothing to wait for
+            if len(self._hb_heap) == 1:
+                self._state_cv.notify()
+
+    def _record_heartbeats(self, manager_ids: List[str], now: float) -> None:
+        """Record the same heartbeat time for several managers at once."""
+        with self._state_lock:
+            for manager_id in manager_ids:
+                self._record_heartbeat(manager_id, now)
 
     def _check_heartbeats(self) -> None:
-        """Check for managers that have missed heartbeats and unregister their actors."""
-        now = time.monotonic()
-        stale_managers = []
-
-        for manager_id, last_hb in self._heartbeats.items():
-            if now - last_hb > self.HEARTBEAT_TIMEOUT_S:
-                stale_managers.append(manager_id)
-
-        for manager_id in stale_managers:
-            logger.warning(f"Manager '{manager_id}' timed out, unregistering its actors")
-            self._unregister_manager(manager_id)
+        """Check for managers that have missed heartbeats and unregister their actors.
+
+        Only heap entries older than the timeout are examined, so healthy
+        managers cost nothing per check. Afterwards the heap top is a live
+        entry, so it gives the next deadline.
+        """
+        deadline = time.monotonic() - self.HEARTBEAT_TIMEOUT_S
+
+        with self._state_lock:
+            heap = self._hb_heap
+            while heap:
+                hb_time, manager_id = heap[0]
+                if self._heartbeats.get(manager_id) != hb_time:
+                    # Superseded by a newer heartbeat or already removed
+                    heapq.heappop(heap)
+                elif hb_time < deadline:
+                    heapq.heappop(heap)
+                    logger.warning(f"Manager '{manager_id}' timed out, unregistering its actors")
+                    self._unregister_manager(manager_id)
+                else:
+                    break
 
     def _unregister_manager(self, manager_id: str) -> None:
         """Unregister all actors belonging to a manager."""
-        # Get actors for this manager
-        actor_names = self._manager_actors.pop(manager_id, set())
-
-        # Remove each actor from registry
-        for actor_name in actor_names:
-            if actor_name in self._registry:
-                del self._registry[actor_name]
-                logger.info(f"Unregistered '{actor_name}' (manager '{manager_id}' timed out)")
-
-        # Remove heartbeat tracking
-        self._heartbeats.pop(manager_id, None)
-
-    def is_manager_online(self, manager_id: str) -> bool:
-        """Check if a manager has recent heartbeat."""
-        if manager_id not in self._heartbeats:
+        with self._state_lock:
+            # Get actors for this manager
+            actor_names = self._manager_actors.pop(manager_id, set())
+
+            # Remove each actor from registry
+            log_info = logger.isEnabledFor(logging.INFO)
+            for actor_name in actor_names:
+                if self._registry.pop(actor_name, None) is not None and log_info:
+                    logger.info("Unregistered '%s' (manager '%s' timed out)",
+                                actor_name, manager_id)
+
+            # Remove heartbeat tracking
+            self._heartbeats.pop(manager_id, None)
+            self._invalidate_snapshots()
+
+    def is_manager_online(self, manager_id: str, now: Optional[float] = None) -> bool:
+        """Check if a manager has recent heartbeat.
+
+        Pass ``now`` to reuse a timestamp already taken for the current request.
+        """
+        with self._state_lock:
+            last_hb = self._heartbeats.get(manager_id)
+        if last_hb is None:
             return False
-        elapsed = time.monotonic() - self._heartbeats[manager_id]
-        return elapsed < self.HEARTBEAT_TIMEOUT_S
+        if now is None:
+            now = time.monotonic()
+        return now - last_hb < self.HEARTBEAT_TIMEOUT_S
 
     def lookup(self, actor_name: str) -> Optional[str]:
         """Synchronous lookup - returns endpoint or None."""
-        entry = self._registry.get(actor_name)
+        with self._state_lock:
+            entry = self._registry.get(actor_name)
         if entry:
             return entry.endpoint
         return None
 
-    def get_all_actors(self) -> List[str]:
-        """Get list of all registered actor names."""
-        return list(self._registry.keys())
-
-    def get_all_managers(self) -> List[str]:
-        """Get list of all registered manager IDs."""
-        return list(self._manager_actors.keys())
+    def get_all_actors(self) -> Sequence[str]:
+        """Get all registered actor names as an immutable snapshot."""
+        with self._state_lock:
+            if self._actor_names_cache is None:
+                self._actor_names_cache = tuple(self._registry)
+            return self._actor_names_cache
+
+    def get_all_managers(self) -> Sequence[str]:
+        """Get all registered manager IDs as an immutable snapshot."""
+        with self._state_lock:
+            if self._manager_ids_cache is None:
+                self._manager_ids_cache = tuple(self._manager_actors)
+            return self._manager_ids_cache
+
+    def _invalidate_snapshots(self) -> None:
+        """Drop cached name snapshots after a membership change."""
+        self._actor_names_cache = None
+        self._manager_ids_cache = None
 
     # Message handlers
 
     def _on_register(self, msg: RegisterActor, ctx) -> None:
         """Handle actor registration."""
-        if msg.actor_name in self._registry:
-            logger.warning(f"Registration failed: '{msg.actor_name}' already registered")
-            ctx.reply(RegistrationFailed(
-                actor_name=msg.actor_name,
-                reason="Name already registered"
-            ))
-            return
-
-        # Register the actor
-        self._registry[msg.actor_name] = ActorEntry(
-            endpoint=msg.actor_endpoint,
-            manager_id=msg.manager_id
-        )
-
-        # Track which actors belong to which manager
-        if msg.manager_id not in self._manager_actors:
-            self._manager_actors[msg.manager_id] = set()
-        self._manager_actors[msg.manager_id].add(msg.actor_name)
-
-        # Registration counts as heartbeat
-        self._heartbeats[msg.manager_id] = time.monotonic()
-
-        logger.info(f"Registered '{msg.actor_name}' from manager '{msg.manager_id}'")
-        ctx.reply(RegistrationOk(actor_name=msg.actor_name))
+        ctx.reply(_do_register(
+            self, msg.manager_id, msg.actor_name, msg.actor_endpoint, time.monotonic()
+        ))
 
     def _on_unregister(self, msg: UnregisterActor, ctx) -> None:
         """Handle actor unregistration."""
-        entry = self._registry.pop(msg.actor_name, None)
-        if entry is None:
-            logger.warning(f"Unregister failed: '{msg.actor_name}' not found")
-            return
-
-        # Remove from manager's actor set
-        if entry.manager_id in self._manager_actors:
-            self._manager_actors[entry.manager_id].discard(msg.actor_name)
-
-        logger.info(f"Unregistered '{msg.actor_name}'")
+        _do_unregister(self, msg.actor_name)
 
     def _on_lookup(self, msg: LookupActor, ctx) -> None:
         """Handle actor lookup."""
-        entry = self._registry.get(msg.actor_name)
+        ctx.reply(_do_lookup(self, msg.actor_name, time.monotonic()))
 
-        if entry is None:
-            ctx.reply(LookupResult(
-                actor_name=msg.actor_name,
-                endpoint=None,
-                online=False
-            ))
-            return
-
-        online = self.is_manager_online(entry.manager_id)
-        ctx.reply(LookupResult(
-            actor_name=msg.actor_name,
-            endpoint=entry.endpoint,
-            online=online
-        ))
+    def _on_lookup_many(self, msg: LookupManyActors, ctx) -> None:
+        """Handle a bulk actor lookup."""
+        ctx.reply(_do_lookup_many(self, msg.actor_names, time.monotonic()))
 
     def _on_heartbeat(self, msg: Heartbeat, ctx) -> None:
         """Handle heartbeat from manager."""
-        self._heartbeats[msg.manager_id] = time.monotonic()
-        ctx.reply(HeartbeatAck())
+        ctx.reply(_do_heartbeat(self, msg.manager_id, time.monotonic()))
+
+    def _on_batch_heartbeat(self, msg: BatchHeartbeat, ctx) -> None:
+        """Handle a batched heartbeat covering several managers."""
+        self._record_heartbeats(msg.manager_ids, time.monotonic())
+        ctx.reply(HEARTBEAT_ACK)
 
     # Process management via SSH
 
     def _on_start_manager(self, msg: StartManager, ctx) -> None:
         """Start a manager via SSH + systemctl."""
-        result = self._systemctl_command(msg.manager_id, "start")
-        ctx.reply(result)
+        self._submit_systemctl(msg.manager_id, "start", ctx)
 
     def _on_stop_manager(self, msg: StopManager, ctx) -> None:
         """Stop a manager via SSH + systemctl."""
-        result = self._systemctl_command(msg.manager_id, "stop")
-        ctx.reply(result)
+        self._submit_systemctl(msg.manager_id, "stop", ctx)
 
     def _on_restart_manager(self, msg: RestartManager, ctx) -> None:
         """Restart a manager via SSH + systemctl."""
-        result = self._systemctl_command(msg.manager_id, "restart")
-        ctx.reply(result)
+        self._submit_systemctl(msg.manager_id, "restart", ctx)
+
+    def _submit_systemctl(self, manager_id: str, action: str, ctx=None) -> Future:
+        """Run a systemctl command on the SSH pool.
+
+        Returns immediately so heartbeats and lookups keep flowing while SSH
+        runs. If ctx is given, the resulting ManagerStatus is posted back to
+        this actor's mailbox and sent with ctx.reply() from the actor thread.
+        """
+        future = self._ssh_pool.submit(self._systemctl_command, manager_id, action)
+        if ctx is not None:
+            future.add_done_callback(
+                lambda f: self._actor_ref.send(SystemctlDone(f.result(), ctx))
+            )
+        return future
+
+    def on_systemctldone(self, env) -> None:
+        """Reply with a finished systemctl command's status."""
+        env.msg.ctx.reply(env.msg.status)
 
     def _systemctl_command(self, manager_id: str, action: str) -> ManagerStatus:
         """Execute systemctl command via SSH."""
-        host_id = self._manager_to_host.get(manager_id)
-        if not host_id or host_id not in self._hosts:
+        host_index = self._manager_host.get(manager_id)
+        if host_index is None:
             return ManagerStatus(
                 manager_id=manager_id,
                 running=False,
                 error=f"Unknown manager: {manager_id}"
             )
 
-        host = self._hosts[host_id]
-        manager_config = host.managers.get(manager_id, {})
-        service_name = manager_config.get("service", manager_id)
+        service_name = self._manager_service[manager_id]
 
         cmd = f"sudo systemctl {action} {service_name}"
-        ssh_cmd = ["ssh", host.ssh, cmd]
+        ssh_cmd = ["ssh", *self.SSH_OPTIONS, self._host_ssh[host_index], cmd]
 
         try:
             logger.info(f"Executing: {' '.join(ssh_cmd)}")
@@ -320,22 +408,226 @@ class GlobalRegistry(Actor):
     def _restart_manager_via_ssh(self, manager_id: str) -> None:
         """Auto-restart a manager that missed heartbeats."""
         logger.info(f"Auto-restarting manager {manager_id}")
-        self._systemctl_command(manager_id, "restart")
+        self._submit_systemctl(manager_id, "restart")
+
+
+# Registry operations shared by the GlobalRegistry message handlers and the
+# raw-ZMQ handlers used by run_registry. Callers read the monotonic clock once
+# per request and pass it in as ``now``.
+
+def _do_register(registry: GlobalRegistry, manager_id: str, actor_name: str,
+                 endpoint: str, now: float):
+    """Register an actor; returns RegistrationOk or RegistrationFailed."""
+    manager_id = sys.intern(manager_id)
+    actor_name = sys.intern(actor_name)
+    entry = ActorEntry(endpoint=endpoint, manager_id=manager_id)
+    with registry._state_lock:
+        # Single probe: setdefault returns the existing entry if the name is taken
+        if registry._registry.setdefault(actor_name, entry) is not entry:
+            logger.warning("Registration failed: '%s' already registered", actor_name)
+            return RegistrationFailed(
+                actor_name=actor_name,
+                reason="Name already registered"
+            )
+
+        # Track which actors belong to which manager
+        registry._manager_actors.setdefault(manager_id, set()).add(actor_name)
 
+        # Registration counts as heartbeat
+        registry._record_heartbeat(manager_id, now)
+        registry._invalidate_snapshots()
+
+    # Registration logging is on the request path; skip formatting when off
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Registered '%s' from manager '%s'", actor_name, manager_id)
+    return RegistrationOk(actor_name=actor_name)
+
+
+def _do_unregister(registry: GlobalRegistry, actor_name: str) -> bool:
+    """Unregister an actor; returns False if it was not registered."""
+    with registry._state_lock:
+        entry = registry._registry.pop(actor_name, None)
+        if entry is None:
+            logger.warning("Unregister failed: '%s' not found", actor_name)
+            return False
 
-def run_registry(endpoint: str = "tcp://0.0.0.0:5555", config_path: str = None):
+        # Remove from manager's actor set
+        actor_names = registry._manager_actors.get(entry.manager_id)
+        if actor_names is not None:
+            actor_names.discard(actor_name)
+        registry._invalidate_snapshots()
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Unregistered '%s'", actor_name)
+    return True
+
+
+def _do_lookup(registry: GlobalRegistry, actor_name: str, now: float) -> LookupResult:
+    """Look up an actor's endpoint and online status."""
+    with registry._state_lock:
+        entry = registry._registry.get(actor_name)
+        if entry is None:
+            return LookupResult(actor_name=actor_name, endpoint=None, online=False)
+        return LookupResult(
+            actor_name=actor_name,
+            endpoint=entry.endpoint,
+            online=registry.is_manager_online(entry.manager_id, now)
+        )
+
+
+def _do_lookup_many(registry: GlobalRegistry, actor_names: List[str],
+                    now: float) -> LookupManyResult:
+    """Look up several actors under a single lock acquisition."""
+    results = {}
+    with registry._state_lock:
+        for actor_name in actor_names:
+            entry = registry._registry.get(actor_name)
+            if entry is None:
+                results[actor_name] = (None, False)
+            else:
+                results[actor_name] = (
+                    entry.endpoint,
+                    registry.is_manager_online(entry.manager_id, now)
+                )
+    return LookupManyResult(results=results)
+
+
+def _do_heartbeat(registry: GlobalRegistry, manager_id: str, now: float) -> HeartbeatAck:
+    """Record a heartbeat from a manager."""
+    registry._record_heartbeat(manager_id, now)
+    return HEARTBEAT_ACK
+
+
+# Raw-ZMQ request handlers used by run_registry. Each takes the registry, the
+# decoded request dict and the request timestamp, and returns the reply
+# message (or a plain dict).
+
+def _handle_register(registry: GlobalRegistry, msg_json: dict, now: float):
+    """Handle a RegisterActor request."""
+    return _do_register(
+        registry,
+        msg_json['manager_id'],
+        msg_json['actor_name'],
+        msg_json['actor_endpoint'],
+        now
+    )
+
+
+def _handle_unregister(registry: GlobalRegistry, msg_json: dict, now: float):
+    """Handle an UnregisterActor request."""
+    actor_name = msg_json['actor_name']
+    _do_unregister(registry, actor_name)
+    return RegistrationOk(actor_name=actor_name)
+
+
+def _handle_lookup(registry: GlobalRegistry, msg_json: dict, now: float):
+    """Handle a LookupActor request."""
+    return _do_lookup(registry, msg_json['actor_name'], now)
+
+
+def _handle_lookup_many(registry: GlobalRegistry, msg_json: dict, now: float):
+    """Handle a LookupManyActors request."""
+    return _do_lookup_many(registry, msg_json['actor_names'], now)
+
+
+def _handle_heartbeat(registry: GlobalRegistry, msg_json: dict, now: float):
+    """Handle a Heartbeat request."""
+    return _do_heartbeat(registry, msg_json['manager_id'], now)
+
+
+def _handle_batch_heartbeat(registry: GlobalRegistry, msg_json: dict, now: float):
+    """Handle a BatchHeartbeat request."""
+    registry._record_heartbeats(msg_json['manager_ids'], now)
+    return HEARTBEAT_ACK
+
+
+# message_type -> handler, so dispatch is a single dict lookup per request
+_HANDLERS = {
+    'RegisterActor': _handle_register,
+    'UnregisterActor': _handle_unregister,
+    'LookupActor': _handle_lookup,
+    'LookupManyActors': _handle_lookup_many,
+    'Heartbeat': _handle_heartbeat,
+    'BatchHeartbeat': _handle_batch_heartbeat,
+}
+
+
+# HeartbeatAck never changes, so it is encoded once per wire format
+# (keyed by the 'binary' flag from wire.decode_with_format).
+_HEARTBEAT_ACK_BYTES = {False: HEARTBEAT_ACK_BYTES}
+if wire.HAVE_MSGPACK:
+    _HEARTBEAT_ACK_BYTES[True] = wire.encode(HEARTBEAT_ACK.to_dict(), binary=True)
+
+
+def _process_request(registry: GlobalRegistry, msg_bytes: bytes) -> bytes:
+    """Decode a request, dispatch it, and encode the reply in the same format."""
+    msg_json, binary = wire.decode_with_format(msg_bytes)
+
+    msg_type = msg_json.get('message_type')
+    # Pipelining clients tag requests with a corr_id to match replies
+    corr_id = msg_json.get('corr_id')
+
+    # Fast path for the dominant request: no reply object, no encoding
+    if msg_type == 'Heartbeat' and corr_id is None:
+        registry._record_heartbeat(msg_json['manager_id'], time.monotonic())
+        return _HEARTBEAT_ACK_BYTES[binary]
+
+    handler = _HANDLERS.get(msg_type)
+    if handler is not None:
+        reply = handler(registry, msg_json, time.monotonic())
+    else:
+        logger.warning(f"Unknown message type: {msg_type}")
+        reply = {'error': f'Unknown message type: {msg_type}'}
+
+    if hasattr(reply, 'to_dict'):
+        reply = reply.to_dict()
+    if corr_id is not None:
+        reply['corr_id'] = corr_id
+    return wire.encode(reply, binary)
+
+
+def _process_heartbeat_datagram(registry: GlobalRegistry, data: bytes) -> None:
+    """Record the managers named in a UDP heartbeat datagram.
+
+    Datagrams get no reply. Anything other than a well-formed Heartbeat or
+    BatchHeartbeat is dropped.
+    """
+    try:
+        msg_json = wire.decode(data)
+        msg_type = msg_json.get('message_type')
+        if msg_type == 'BatchHeartbeat':
+            registry._record_heartbeats(msg_json['manager_ids'], time.monotonic())
+        elif msg_type == 'Heartbeat':
+            registry._record_heartbeat(msg_json['manager_id'], time.monotonic())
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        logger.debug("Dropping malformed heartbeat datagram: %s", e)
+
+
+def _bind_heartbeat_socket(endpoint: str, port: int):
+    """Bind a non-blocking UDP socket on the host of a tcp:// endpoint."""
+    import socket as pysocket
+
+    host = endpoint.split('://', 1)[-1].rsplit(':', 1)[0]
+    if host == '*':
+        host = ''
+    udp_socket = pysocket.socket(pysocket.AF_INET, pysocket.SOCK_DGRAM)
+    udp_socket.bind((host, port))
+    udp_socket.setblocking(False)
+    return udp_socket
+
+
+def run_registry(endpoint: str = "tcp://0.0.0.0:5555", config_path: str = None,
+                 heartbeat_port: Optional[int] = None):
     """Run the GlobalRegistry as a standalone ZMQ server.
 
     Args:
         endpoint: ZMQ endpoint to bind to (default: tcp://0.0.0.0:5555)
         config_path: Optional path to registry.json config file
+        heartbeat_port: Optional UDP port for heartbeat datagrams, bound on
+            the same host as endpoint
     """
     import zmq
     import signal
-    from .registry_messages import (
-        RegisterActor, UnregisterActor, LookupActor, Heartbeat,
-        RegistrationOk, RegistrationFailed, LookupResult, HeartbeatAck
-    )
 
     logging.basicConfig(
         level=logging.INFO,
@@ -350,9 +642,20 @@ def run_registry(endpoint: str = "tcp://0.0.0.0:5555", config_path: str = None):
 
     # Create ZMQ socket
     context = zmq.Context()
-    socket = context.socket(zmq.REP)
+    socket = context.socket(zmq.ROUTER)
     socket.bind(endpoint)
 
+    poller = zmq.Poller()
+    poller.register(socket, zmq.POLLIN)
+
+    udp_socket = None
+    udp_fd = None  # Poller reports raw sockets by file descriptor
+    if heartbeat_port is not None:
+        udp_socket = _bind_heartbeat_socket(endpoint, heartbeat_port)
+        udp_fd = udp_socket.fileno()
+        poller.register(udp_fd, zmq.POLLIN)
+        logger.info(f"Accepting UDP heartbeats on port {heartbeat_port}")
+
     running = True
 
     def signal_handler(sig, frame):
@@ -368,76 +671,26 @@ def run_registry(endpoint: str = "tcp://0.0.0.0:5555", config_path: str = None):
     while running:
         try:
             # Poll with timeout so we can check running flag
-            if socket.poll(1000):
-                msg_bytes = socket.recv()
-                msg_json = json.loads(msg_bytes.decode('utf-8'))
-
-                msg_type = msg_json.get('message_type')
-                reply = None
-
-                if msg_type == 'RegisterActor':
-                    msg = RegisterActor(
-                        manager_id=msg_json['manager_id'],
-                        actor_name=msg_json['actor_name'],
-                        actor_endpoint=msg_json['actor_endpoint']
-                    )
-                    if msg.actor_name in registry._registry:
-                        reply = RegistrationFailed(
-                            actor_name=msg.actor_name,
-                            reason="Name already registered"
-                        )
-                    else:
-                        registry._registry[msg.actor_name] = ActorEntry(
-                            endpoint=msg.actor_endpoint,
-                            manager_id=msg.manager_id
-                        )
-                        if msg.manager_id not in registry._manager_actors:
-                            registry._manager_actors[msg.manager_id] = set()
-                        registry._manager_actors[msg.manager_id].add(msg.actor_name)
-                        registry._heartbeats[msg.manager_id] = time.monotonic()
-                        logger.info(f"Registered '{msg.actor_name}' from '{msg.manager_id}'")
-                        reply = RegistrationOk(actor_name=msg.actor_name)
-
-                elif msg_type == 'UnregisterActor':
-                    actor_name = msg_json['actor_name']
-                    entry = registry._registry.pop(actor_name, None)
-                    if entry and entry.manager_id in registry._manager_actors:
-                        registry._manager_actors[entry.manager_id].discard(actor_name)
-                    logger.info(f"Unregistered '{actor_name}'")
-                    reply = RegistrationOk(actor_name=actor_name)
-
-                elif msg_type == 'LookupActor':
-                    actor_name = msg_json['actor_name']
-                    entry = registry._registry.get(actor_name)
-                    if entry:
-                        online = registry.is_manager_online(entry.manager_id)
-                        reply = LookupResult(
-                            actor_name=actor_name,
-                            endpoint=entry.endpoint,
-                            online=online
-                        )
-                    else:
-                        reply = LookupResult(
-                            actor_name=actor_name,
-                            endpoint=None,
-                            online=False
-                        )
-
-                elif msg_type == 'Heartbeat':
-                    manager_id = msg_json['manager_id']
-                    registry._heartbeats[manager_id] = time.monotonic()
-                    reply = HeartbeatAck()
-
-                else:
-                    logger.warning(f"Unknown message type: {msg_type}")
-                    reply = {'error': f'Unknown message type: {msg_type}'}
-
-                # Send reply
-                if hasattr(reply, 'to_dict'):
-                    reply_json = reply.to_dict()
-                else:
-                    reply_json = reply
-                socket.send(json.dumps(reply_json).encode('utf-8'))
+            ready = dict(poller.poll(1000))
+
+            # Drain every queued request before polling again. ROUTER frames
+            # are [identity, (b'' for REQ peers), payload]; the reply reuses
+            # the same envelope so it is routed back to the right peer.
+            while socket in ready:
+                try:
+                    frames = socket.recv_multipart(zmq.NOBLOCK)
+                except zmq.Again:
+                    break
+                envelope, msg_bytes = frames[:-1], frames[-1]
+                envelope.append(_process_request(registry, msg_bytes))
+                socket.send_multipart(envelope)
+
+            while udp_fd is not None and udp_fd in ready:
+                try:
+                    data = udp_socket.recv(65535)
+                except BlockingIOError:
+                    break
+                _process_heartbeat_datagram(registry, data)
 
         except zmq.ZMQError as e:
             if running:
@@ -445,6 +698,8 @@ def run_registry(endpoint: str = "tcp://0.0.0.0:5555", config_path: str = None):
 
     # Cleanup
     registry.end()
+    if udp_socket is not None:
+        udp_socket.close()
     socket.close()
     context.term()
     logger.info("GlobalRegistry stopped")
@@ -464,6 +719,12 @@ if __name__ == "__main__":
         default=None,
         help="Path to registry.json config file"
     )
+    parser.add_argument(
+        "--heartbeat-port",
+        type=int,
+        default=None,
+        help="UDP port to accept heartbeat datagrams on (default: TCP only)"
+    )
 
     args = parser.parse_args()
-    run_registry(args.endpoint, args.config)
+    run_registry(args.endpoint, args.config, args.heartbeat_port)
@@ -5,15 +5,19 @@ THIS SOFTWARE IS OPEN SOURCE UNDER THE MIT LICENSE
 Copyright 2025 Vincent Maciejewski, & M2 Tech
 """
 
-import json
+import itertools
+import socket as pysocket
 import threading
 import time
-from typing import Optional, Tuple
+import weakref
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Set, Tuple
 
 import zmq
 
+from . import wire
 from .registry_messages import (
-    RegisterActor, LookupActor, Heartbeat
+    RegisterActor, LookupActor, LookupManyActors, BatchHeartbeat
 )
 
 
@@ -49,14 +53,170 @@ class TimeoutError(RegistryError):
     pass
 
 
+class _PendingReply:
+    """A request waiting for its correlated reply."""
+    __slots__ = ('event', 'reply')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.reply: Optional[dict] = None
+
+
+class HeartbeatBatcher:
+    """Sends heartbeats for every manager in the process in one message.
+
+    There is one batcher per registry endpoint, shared by all RegistryClients
+    in the process. On each tick it sends a single BatchHeartbeat listing
+    every manager_id currently added, instead of one round trip per client.
+    The batcher's thread runs only while at least one manager is added.
+
+    With a heartbeat_port the BatchHeartbeat is sent as a UDP datagram to
+    that port on the registry host (see run_registry's heartbeat_port)
+    instead of over ZMQ. A lost datagram is harmless: the registry only
+    marks a manager offline after three missed intervals.
+    """
+
+    HEARTBEAT_INTERVAL_S = 2.0
+
+    _instances: Dict[Tuple[str, Optional[int]], 'HeartbeatBatcher'] = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def for_endpoint(cls, registry_endpoint: str,
+                     heartbeat_port: Optional[int] = None) -> 'HeartbeatBatcher':
+        """Get the process-wide batcher for a registry endpoint."""
+        key = (registry_endpoint, heartbeat_port)
+        with cls._instances_lock:
+            batcher = cls._instances.get(key)
+            if batcher is None:
+                batcher = cls(registry_endpoint, heartbeat_port)
+                cls._instances[key] = batcher
+            return batcher
+
+    def __init__(self, registry_endpoint: str, heartbeat_port: Optional[int] = None):
+        self.registry_endpoint = registry_endpoint
+        self.heartbeat_port = heartbeat_port
+
+        # manager_id -> number of clients heartbeating for it
+        self._manager_ids: Dict[str, int] = {}
+        # Encoded BatchHeartbeat; the payload only depends on the set of
+        # manager ids, so it is rebuilt only when that set changes
+        self._payload: Optional[bytes] = None
+        self._lock = threading.Lock()
+        # Each batcher thread gets its own stop Event, so a thread that is
+        # still stopping cannot be revived by a later add()
+        self._stop: Optional[threading.Event] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, manager_id: str) -> None:
+        """Start heartbeating for a manager."""
+        with self._lock:
+            count = self._manager_ids.get(manager_id, 0)
+            self._manager_ids[manager_id] = count + 1
+            if count == 0:
+                self._payload = None
+            if self._thread is None:
+                self._stop = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._run if self.heartbeat_port is None else self._run_udp,
+                    args=(self._stop,),
+                    daemon=True,
+                    name="heartbeat-batcher"
+                )
+                self._thread.start()
+
+    def remove(self, manager_id: str) -> None:
+        """Stop heartbeating for a manager; stops the thread when none remain."""
+        thread = None
+        with self._lock:
+            count = self._manager_ids.get(manager_id, 0)
+            if count > 1:
+                self._manager_ids[manager_id] = count - 1
+            elif self._manager_ids.pop(manager_id, None) is not None:
+                self._payload = None
+            if not self._manager_ids and self._thread is not None:
+                thread = self._thread
+                self._thread = None
+                self._stop.set()
+                self._stop = None
+        if thread is not None:
+            thread.join(timeout=3.0)
+
+    def _heartbeat_payload(self) -> Optional[bytes]:
+        """Return the encoded BatchHeartbeat, or None if no managers are added."""
+        with self._lock:
+            if self._payload is None and self._manager_ids:
+                msg = BatchHeartbeat(manager_ids=list(self._manager_ids))
+                self._payload = wire.encode(msg.to_dict())
+            return self._payload
+
+    def _run(self, stop: threading.Event) -> None:
+        """Batcher thread: one BatchHeartbeat per tick over its own DEALER."""
+        socket = zmq.Context.instance().socket(zmq.DEALER)
+        socket.setsockopt(zmq.LINGER, 0)
+        socket.connect(self.registry_endpoint)
+        try:
+            while not stop.is_set():
+                payload = self._heartbeat_payload()
+                if payload is not None:
+                    try:
+                        socket.send_multipart([b'', payload], zmq.NOBLOCK)
+                    except zmq.ZMQError:
+                        # Registry unreachable; try again next tick
+                        pass
+
+                # Discard acks so they do not pile up
+                while True:
+                    try:
+                        socket.recv_multipart(zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+
+                stop.wait(self.HEARTBEAT_INTERVAL_S)
+        finally:
+            socket.close()
+
+    def _run_udp(self, stop: threading.Event) -> None:
+        """Batcher thread: one BatchHeartbeat datagram per tick, no acks."""
+        host = self.registry_endpoint.split('://', 1)[-1].rsplit(':', 1)[0]
+        udp_socket = pysocket.socket(pysocket.AF_INET, pysocket.SOCK_DGRAM)
+        try:
+            while not stop.is_set():
+                payload = self._heartbeat_payload()
+                if payload is not None:
+                    try:
+                        udp_socket.sendto(payload, (host, self.heartbeat_port))
+                    except OSError:
+                        # Registry unreachable; try again next tick
+                        pass
+                stop.wait(self.HEARTBEAT_INTERVAL_S)
+        finally:
+            udp_socket.close()
+
+
+class _Outbox:
+    """Holder for a thread's outbox socket, kept in thread-local storage."""
+
+    __slots__ = ('socket', '__weakref__')
+
+    def __init__(self, socket: zmq.Socket):
+        self.socket = socket
+
+
 class RegistryClient:
     """Client for communicating with the GlobalRegistry.
 
     The RegistryClient:
-    - Sends heartbeats every 2 seconds in a background thread
-    - Provides sync lookup for actors by name
+    - Sends heartbeats every 2 seconds via the process-wide HeartbeatBatcher
+    - Provides sync lookup for actors by name, caching hits briefly
     - Handles registration of local actors
 
+    Requests travel over a single DEALER socket owned by an I/O thread, so
+    several requests can be in flight at once. Each request carries a
+    corr_id that the registry echoes back; the I/O thread uses it to hand
+    the reply to the waiting caller. Heartbeats go through a separate
+    socket and never hold up lookups.
+
     Example:
         client = RegistryClient("MyManager", "tcp://localhost:5555")
         client.start_heartbeat()
@@ -70,71 +230,184 @@ class RegistryClient:
         client.stop_heartbeat()
     """
 
-    HEARTBEAT_INTERVAL_S = 2.0
+    HEARTBEAT_INTERVAL_S = HeartbeatBatcher.HEARTBEAT_INTERVAL_S
+    REQUEST_TIMEOUT_S = 5.0
 
-    def __init__(self, manager_id: str, registry_endpoint: str):
+    # Successful lookups are reused for one heartbeat interval without
+    # asking the registry
+    LOOKUP_CACHE_TTL_S = HEARTBEAT_INTERVAL_S
+    LOOKUP_CACHE_SIZE = 256
+
+    def __init__(self, manager_id: str, registry_endpoint: str,
+                 heartbeat_port: Optional[int] = None):
         """Create a new registry client.
 
         Args:
             manager_id: Unique identifier for this manager
             registry_endpoint: ZMQ endpoint of the GlobalRegistry (e.g., "tcp://localhost:5555")
+            heartbeat_port: Optional UDP port the registry accepts heartbeat
+                datagrams on; if None, heartbeats go over ZMQ
         """
         self.manager_id = manager_id
         self.registry_endpoint = registry_endpoint
+        self.heartbeat_port = heartbeat_port
 
         self._context = zmq.Context.instance()
-        self._socket: Optional[zmq.Socket] = None
+
+        # Callers push encoded requests to the I/O thread over inproc. Each
+        # calling thread gets its own PUSH socket, so sending takes no lock.
+        self._local = threading.local()
+        self._outboxes: Set[zmq.Socket] = set()
+        self._outbox_endpoint = f"inproc://registry-client-{id(self)}"
+        # Guards I/O thread startup and the _outboxes set
         self._socket_lock = threading.Lock()
+        self._io_thread: Optional[threading.Thread] = None
+
+        # corr_id -> request waiting for a reply
+        self._pending: Dict[int, _PendingReply] = {}
+        self._pending_lock = threading.Lock()
+        self._corr_ids = itertools.count(1)
+
+        self._batcher: Optional[HeartbeatBatcher] = None
 
-        self._heartbeat_thread: Optional[threading.Thread] = None
-        self._running = False
+        # actor_name -> (endpoint, expiry), least recently used first
+        self._lookup_cache: 'OrderedDict[str, Tuple[str, float]]' = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def _get_socket(self) -> zmq.Socket:
-        """Get or create the ZMQ REQ socket."""
-        if self._socket is None:
-            self._socket = self._context.socket(zmq.REQ)
-            self._socket.setsockopt(zmq.RCVTIMEO, 5000)  # 5 second timeout
-            self._socket.connect(self.registry_endpoint)
-        return self._socket
+        """Get the calling thread's outbox socket.
 
-    def _send_recv(self, msg: dict) -> dict:
-        """Send a message and receive a reply."""
+        The socket is created and connected on a thread's first request, and
+        the I/O thread is started on the first request overall. It is closed
+        when the thread exits, or by close().
+        """
+        holder = getattr(self._local, 'outbox', None)
+        if holder is None or holder.socket.closed:
+            with self._socket_lock:
+                if self._io_thread is None:
+                    self._start_io_thread()
+                outbox = self._context.socket(zmq.PUSH)
+                outbox.setsockopt(zmq.LINGER, 0)
+                outbox.connect(self._outbox_endpoint)
+                self._outboxes.add(outbox)
+            holder = self._local.outbox = _Outbox(outbox)
+            # Thread-local data is dropped when its thread exits
+            weakref.finalize(holder, self._release_outbox, outbox)
+        return holder.socket
+
+    def _release_outbox(self, outbox: zmq.Socket) -> None:
+        """Close an exited thread's outbox socket."""
         with self._socket_lock:
-            socket = self._get_socket()
-            socket.send_json(msg)
-            return socket.recv_json()
+            self._outboxes.discard(outbox)
+            outbox.close()
+
+    def _start_io_thread(self) -> None:
+        """Start the I/O thread. Must be called with _socket_lock held."""
+        # Create both thread-owned sockets here and hand them over, so the
+        # inbox is bound before any outbox connects to it.
+        dealer = self._context.socket(zmq.DEALER)
+        dealer.setsockopt(zmq.LINGER, 0)
+        dealer.connect(self.registry_endpoint)
+        inbox = self._context.socket(zmq.PULL)
+        inbox.setsockopt(zmq.LINGER, 0)
+        inbox.bind(self._outbox_endpoint)
+
+        self._io_thread = threading.Thread(
+            target=self._io_loop,
+            args=(dealer, inbox),
+            daemon=True,
+            name=f"registry-io-{self.manager_id}"
+        )
+        self._io_thread.start()
+
+    def _io_loop(self, dealer: zmq.Socket, inbox: zmq.Socket) -> None:
+        """I/O thread: forward requests to the registry and route replies.
+
+        An empty frame on the inbox asks the thread to exit.
+        """
+        poller = zmq.Poller()
+        poller.register(dealer, zmq.POLLIN)
+        poller.register(inbox, zmq.POLLIN)
+
+        running = True
+        while running:
+            events = dict(poller.poll())
+
+            if inbox in events:
+                while True:
+                    try:
+                        payload = inbox.recv(zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+                    if not payload:
+                        running = False
+                        break
+                    # Empty delimiter frame keeps REQ/REP-style framing
+                    dealer.send_multipart([b'', payload])
+
+            if dealer in events:
+                while True:
+                    try:
+                        frames = dealer.recv_multipart(zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+                    self._on_reply(frames[-1])
+
+        dealer.close()
+        inbox.close()
+
+    def _on_reply(self, payload: bytes) -> None:
+        """Hand a reply to the caller waiting on its corr_id."""
+        reply = wire.decode(payload)
+        corr_id = reply.pop('corr_id', None)
+        with self._pending_lock:
+            pending = self._pending.pop(corr_id, None)
+        # Uncorrelated replies (heartbeat acks) and late replies are dropped
+        if pending is not None:
+            pending.reply = reply
+            pending.event.set()
+
+    def _post(self, msg: dict) -> None:
+        """Queue a message for the registry without waiting for a reply."""
+        self._get_socket().send(wire.encode(msg))
+
+    def _send_recv(self, msg: dict) -> dict:
+        """Send a message and wait for its reply.
+
+        Raises:
+            TimeoutError: If no reply arrives within REQUEST_TIMEOUT_S
+        """
+        corr_id = next(self._corr_ids)
+        msg['corr_id'] = corr_id
+        pending = _PendingReply()
+        with self._pending_lock:
+            self._pending[corr_id] = pending
+
+        self._post(msg)
+
+        if not pending.event.wait(self.REQUEST_TIMEOUT_S):
+            with self._pending_lock:
+                self._pending.pop(corr_id, None)
+            raise TimeoutError(
+                f"No response from registry for {msg.get('message_type')}"
+            )
+        return pending.reply
 
     def start_heartbeat(self) -> None:
-        """Start the heartbeat background thread."""
-        if self._running:
+        """Start sending heartbeats for this manager."""
+        if self._batcher is not None:
             return
 
-        self._running = True
-        self._heartbeat_thread = threading.Thread(
-            target=self._heartbeat_loop,
-            daemon=True,
-            name=f"heartbeat-{self.manager_id}"
+        self._batcher = HeartbeatBatcher.for_endpoint(
+            self.registry_endpoint, self.heartbeat_port
         )
-        self._heartbeat_thread.start()
+        self._batcher.add(self.manager_id)
 
     def stop_heartbeat(self) -> None:
-        """Stop the heartbeat background thread."""
-        self._running = False
-        if self._heartbeat_thread:
-            self._heartbeat_thread.join(timeout=3.0)
-            self._heartbeat_thread = None
-
-    def _heartbeat_loop(self) -> None:
-        """Background thread that sends heartbeats."""
-        while self._running:
-            try:
-                hb = Heartbeat(manager_id=self.manager_id)
-                self._send_recv(hb.to_dict())
-            except Exception as e:
-                # Log but don't crash on heartbeat failures
-                pass
-
-            time.sleep(self.HEARTBEAT_INTERVAL_S)
+        """Stop sending heartbeats for this manager."""
+        if self._batcher is not None:
+            self._batcher.remove(self.manager_id)
+            self._batcher = None
 
     def register(self, actor_name: str, endpoint: str) -> None:
         """Register an actor with the GlobalRegistry.
@@ -153,10 +426,7 @@ class RegistryClient:
             actor_endpoint=endpoint
         )
 
-        try:
-            reply = self._send_recv(msg.to_dict())
-        except zmq.Again:
-            raise TimeoutError("No response from registry for registration")
+        reply = self._send_recv(msg.to_dict())
 
         if reply.get('message_type') == 'RegistrationOk':
             return
@@ -182,25 +452,90 @@ class RegistryClient:
             ActorOfflineError: If actor's manager missed heartbeats
             TimeoutError: If no response from registry
         """
+        endpoint = self._cache_get(actor_name)
+        if endpoint is not None:
+            return endpoint
+
         msg = LookupActor(actor_name=actor_name)
 
-        try:
-            reply = self._send_recv(msg.to_dict())
-        except zmq.Again:
-            raise TimeoutError("No response from registry for lookup")
+        reply = self._send_recv(msg.to_dict())
 
         if reply.get('message_type') == 'LookupResult':
             endpoint = reply.get('endpoint')
             online = reply.get('online', False)
 
             if endpoint is None:
+                self.invalidate(actor_name)
                 raise ActorNotFoundError(actor_name)
             if not online:
+                self.invalidate(actor_name)
                 raise ActorOfflineError(actor_name)
+            self._cache_put(actor_name, endpoint)
             return endpoint
         else:
             raise RegistryError(f"Unexpected response: {reply}")
 
+    def lookup_many(self, actor_names: Iterable[str]) -> Dict[str, str]:
+        """Lookup several actors in a single round trip.
+
+        Args:
+            actor_names: Names of the actors to find
+
+        Returns:
+            Dict of actor name -> endpoint for every actor that is registered
+            and online. Names that are unknown or offline are omitted.
+
+        Raises:
+            TimeoutError: If no response from registry
+        """
+        msg = LookupManyActors(actor_names=list(actor_names))
+
+        reply = self._send_recv(msg.to_dict())
+
+        if reply.get('message_type') == 'LookupManyResult':
+            found = {}
+            for name, (endpoint, online) in reply.get('results', {}).items():
+                if endpoint is not None and online:
+                    found[name] = endpoint
+                    self._cache_put(name, endpoint)
+                else:
+                    self.invalidate(name)
+            return found
+        else:
+            raise RegistryError(f"Unexpected response: {reply}")
+
+    def _cache_get(self, actor_name: str) -> Optional[str]:
+        """Return a cached endpoint if it has not expired."""
+        with self._cache_lock:
+            cached = self._lookup_cache.get(actor_name)
+            if cached is None:
+                return None
+            endpoint, expiry = cached
+            if expiry <= time.monotonic():
+                del self._lookup_cache[actor_name]
+                return None
+            self._lookup_cache.move_to_end(actor_name)
+            return endpoint
+
+    def _cache_put(self, actor_name: str, endpoint: str) -> None:
+        """Cache an endpoint, evicting the least recently used if full."""
+        with self._cache_lock:
+            self._lookup_cache[actor_name] = (
+                endpoint, time.monotonic() + self.LOOKUP_CACHE_TTL_S
+            )
+            self._lookup_cache.move_to_end(actor_name)
+            if len(self._lookup_cache) > self.LOOKUP_CACHE_SIZE:
+                self._lookup_cache.popitem(last=False)
+
+    def invalidate(self, actor_name: str) -> None:
+        """Drop the cached endpoint for an actor.
+
+        Call this when the cached endpoint is known to be stale (for example
+        after a delivery failure) so the next lookup asks the registry.
+        """
+        with self._cache_lock:
+            self._lookup_cache.pop(actor_name, None)
+
     def lookup_allow_offline(self, actor_name: str) -> Tuple[str, bool]:
         """Lookup an actor, returning the endpoint even if offline.
 
@@ -219,10 +554,7 @@ class RegistryClient:
         """
         msg = LookupActor(actor_name=actor_name)
 
-        try:
-            reply = self._send_recv(msg.to_dict())
-        except zmq.Again:
-            raise TimeoutError("No response from registry for lookup")
+        reply = self._send_recv(msg.to_dict())
 
         if reply.get('message_type') == 'LookupResult':
             endpoint = reply.get('endpoint')
@@ -237,7 +569,15 @@ class RegistryClient:
     def close(self) -> None:
         """Close the registry client and stop heartbeats."""
         self.stop_heartbeat()
+        if self._io_thread is None:
+            return
+
+        # Empty frame tells the I/O thread to close its sockets and exit
+        self._get_socket().send(b'')
+        self._io_thread.join(timeout=1.0)
+
         with self._socket_lock:
-            if self._socket:
-                self._socket.close()
-                self._socket = None
+            for outbox in self._outboxes:
+                outbox.close()
+            self._outboxes.clear()
+            self._io_thread = None
@@ -5,13 +5,49 @@ THIS SOFTWARE IS OPEN SOURCE UNDER THE MIT LICENSE
 Copyright 2025 Vincent Maciejewski, & M2 Tech
 """
 
-from dataclasses import dataclass, asdict
-from typing import Optional
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Tuple
 import time
 
+from . import wire
+from ._compat import DATACLASS_SLOTS
+
+
+# Heartbeat timestamps only need to be much finer than the 6s timeout, so a
+# coarse clock (jiffy resolution, a few ms) is used where the OS has one.
+if hasattr(time, 'CLOCK_REALTIME_COARSE'):
+    def _now_ms() -> int:
+        return time.clock_gettime_ns(time.CLOCK_REALTIME_COARSE) // 1_000_000
+else:
+    def _now_ms() -> int:
+        return time.time_ns() // 1_000_000
+
+
+# Messages are immutable value objects; slots drop the per-instance __dict__.
+_message = dataclass(frozen=True, **DATACLASS_SLOTS)
+
+
+@_message
+class _Message:
+    """Base class for registry messages."""
 
-@dataclass
-class RegisterActor:
+    def to_dict(self) -> dict:
+        """Return {'message_type': <class name>, <field>: <value>, ...}."""
+        cls = type(self)
+        out = {'message_type': cls.__name__}
+        for name in _FIELDS_CACHE[cls]:
+            out[name] = getattr(self, name)
+        return out
+
+    def to_json_bytes(self) -> bytes:
+        """Encode to_dict() straight to JSON bytes (orjson when installed)."""
+        return wire.encode_json(self.to_dict())
+
+
+@_message
+class RegisterActor(_Message):
     """Manager registers an actor with GlobalRegistry.
 
     Sent during Manager.manage() to register actor name -> endpoint mapping.
@@ -21,44 +57,24 @@ class RegisterActor:
     actor_name: str
     actor_endpoint: str  # ZMQ endpoint for reaching this actor
 
-    def to_dict(self):
-        return {
-            'message_type': 'RegisterActor',
-            'manager_id': self.manager_id,
-            'actor_name': self.actor_name,
-            'actor_endpoint': self.actor_endpoint
-        }
-
 
-@dataclass
-class UnregisterActor:
+@_message
+class UnregisterActor(_Message):
     """Remove an actor from the registry.
 
     Sent when an actor is stopped or Manager shuts down.
     """
     actor_name: str
 
-    def to_dict(self):
-        return {
-            'message_type': 'UnregisterActor',
-            'actor_name': self.actor_name
-        }
-
 
-@dataclass
-class RegistrationOk:
+@_message
+class RegistrationOk(_Message):
     """Confirms successful actor registration."""
     actor_name: str
 
-    def to_dict(self):
-        return {
-            'message_type': 'RegistrationOk',
-            'actor_name': self.actor_name
-        }
-
 
-@dataclass
-class RegistrationFailed:
+@_message
+class RegistrationFailed(_Message):
     """Registration was rejected.
 
     Common reasons: name already registered, invalid endpoint.
@@ -66,16 +82,9 @@ class RegistrationFailed:
     actor_name: str
     reason: str
 
-    def to_dict(self):
-        return {
-            'message_type': 'RegistrationFailed',
-            'actor_name': self.actor_name,
-            'reason': self.reason
-        }
 
-
-@dataclass
-class LookupActor:
+@_message
+class LookupActor(_Message):
     """Request endpoint for a named actor.
 
     Manager sends this when local lookup fails.
@@ -83,15 +92,9 @@ class LookupActor:
     """
     actor_name: str
 
-    def to_dict(self):
-        return {
-            'message_type': 'LookupActor',
-            'actor_name': self.actor_name
-        }
 
-
-@dataclass
-class LookupResult:
+@_message
+class LookupResult(_Message):
     """Response to LookupActor.
 
     Contains the endpoint if found, and online status.
@@ -99,54 +102,94 @@ class LookupResult:
     If online is False, the actor's Manager has missed heartbeats.
     """
     actor_name: str
-    endpoint: Optional[str]
+    endpoint: str | None
     online: bool
 
-    def to_dict(self):
-        return {
-            'message_type': 'LookupResult',
-            'actor_name': self.actor_name,
-            'endpoint': self.endpoint,
-            'online': self.online
-        }
 
+@_message
+class LookupManyActors(_Message):
+    """Request endpoints for several named actors in one round trip.
+
+    GlobalRegistry replies with LookupManyResult.
+    """
+    actor_names: List[str]
+
+
+@_message
+class LookupManyResult(_Message):
+    """Response to LookupManyActors.
 
-@dataclass
-class Heartbeat:
+    Maps each requested name to (endpoint, online), with the same meaning
+    as the fields of LookupResult.
+    """
+    results: Dict[str, Tuple[str | None, bool]]
+
+
+@_message
+class Heartbeat(_Message):
     """Manager health check.
 
     Managers send this every 2 seconds.
     GlobalRegistry marks Manager offline after 6 seconds without heartbeat.
     """
     manager_id: str
-    timestamp_ms: int = 0
+    timestamp_ms: int = field(default_factory=_now_ms)
 
-    def __post_init__(self):
-        if self.timestamp_ms == 0:
-            self.timestamp_ms = int(time.time() * 1000)
 
-    def to_dict(self):
-        return {
-            'message_type': 'Heartbeat',
-            'manager_id': self.manager_id,
-            'timestamp_ms': self.timestamp_ms
-        }
+@_message
+class BatchHeartbeat(_Message):
+    """Heartbeat for several managers in one message.
 
+    Sent by the per-process HeartbeatBatcher on behalf of every manager in
+    the process. GlobalRegistry replies with a single HeartbeatAck.
+    """
+    manager_ids: List[str]
 
-@dataclass
-class HeartbeatAck:
-    """Acknowledgement of heartbeat."""
 
-    def to_dict(self):
-        return {
-            'message_type': 'HeartbeatAck'
-        }
+@_message
+class HeartbeatAck(_Message):
+    """Acknowledgement of heartbeat.
+
+    Carries no state, so HeartbeatAck() always returns the shared instance.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = object.__new__(cls)
+        return cls._instance
+
+
+# Field names of each protocol message in declaration order, read by the
+# shared _Message.to_dict(); looked up once here rather than calling
+# dataclasses.fields() (or asdict()) per message.
+_FIELDS_CACHE: Dict[type, Tuple[str, ...]] = {
+    cls: tuple(f.name for f in fields(cls))
+    for cls in (
+        RegisterActor,
+        UnregisterActor,
+        RegistrationOk,
+        RegistrationFailed,
+        LookupActor,
+        LookupResult,
+        LookupManyActors,
+        LookupManyResult,
+        Heartbeat,
+        BatchHeartbeat,
+        HeartbeatAck,
+    )
+}
+
+
+HEARTBEAT_ACK = HeartbeatAck()
+# JSON encoding of the registry's most frequent reply, built once
+HEARTBEAT_ACK_BYTES = HEARTBEAT_ACK.to_json_bytes()
 
 
 # Process management messages
 
-@dataclass
-class StartManager:
+@_message
+class StartManager(_Message):
     """Request to start a manager process."""
     manager_id: str
 
@@ -154,8 +197,8 @@ class StartManager:
         return {'manager_id': self.manager_id, 'action': 'start'}
 
 
-@dataclass
-class StopManager:
+@_message
+class StopManager(_Message):
     """Request to stop a manager process."""
     manager_id: str
 
@@ -163,8 +206,8 @@ class StopManager:
         return {'manager_id': self.manager_id, 'action': 'stop'}
 
 
-@dataclass
-class RestartManager:
+@_message
+class RestartManager(_Message):
     """Request to restart a manager process."""
     manager_id: str
 
@@ -172,13 +215,13 @@ class RestartManager:
         return {'manager_id': self.manager_id, 'action': 'restart'}
 
 
-@dataclass
-class ManagerStatus:
+@_message
+class ManagerStatus(_Message):
     """Status of a manager process."""
     manager_id: str
     running: bool
-    pid: Optional[int] = None
-    error: Optional[str] = None
+    pid: int | None = None
+    error: str | None = None
 
     def to_dict(self):
         return {
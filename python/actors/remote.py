@@ -6,15 +6,17 @@ THIS SOFTWARE IS OPEN SOURCE UNDER THE MIT LICENSE
 Copyright 2025 Vincent Maciejewski, & M2 Tech
 """
 
-import time
+import threading
+from collections import deque
 from queue import Queue, Empty
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
 
 import zmq
 
+from . import wire
 from .actor import Actor, ActorRef, Envelope
 from .messages import Reject
-from .serialization import serialize_message, deserialize_message
+from .serialization import serialize_batch, serialize_message, deserialize_message
 
 
 class RemoteActorRef(ActorRef):
@@ -37,30 +39,118 @@ class RemoteActorRef(ActorRef):
         """Send a message to remote actor."""
         self._zmq_sender.send_to(self._endpoint, self._name, msg, sender)
 
+    def send_batch(self, msgs: Iterable[Any], sender: Optional[ActorRef] = None) -> None:
+        """Send several messages to the remote actor in one ZMQ message."""
+        self._zmq_sender.send_batch(self._endpoint, self._name, msgs, sender)
+
     def fast_send(self, msg: Any, sender: Optional[ActorRef] = None) -> Any:
         """Not supported for remote actors."""
         raise NotImplementedError("fast_send not supported for remote actors")
 
 
+class _Endpoint:
+    """PUSH socket and send backlog for one remote endpoint.
+
+    While the backlog is non-empty the drain thread owns the socket and
+    senders only append; cond guards the backlog and every use of the
+    socket outside the drain thread's poll.
+    """
+
+    __slots__ = ('socket', 'backlog', 'cond', 'closed')
+
+    def __init__(self, socket: zmq.Socket):
+        self.socket = socket
+        self.backlog: Deque[List[bytes]] = deque()
+        self.cond = threading.Condition()
+        self.closed = False
+
+
 class ZmqSender:
-    """Sends messages to remote processes via ZMQ PUSH sockets."""
+    """Sends messages to remote processes via ZMQ PUSH sockets.
+
+    Messages are sent as JSON by default, which every language runtime
+    understands. Pass binary=True to send msgpack instead when all peers
+    are Python processes (ZmqReceiver accepts either format).
 
-    def __init__(self, context: Optional[zmq.Context] = None, local_endpoint: Optional[str] = None):
+    Sends never wait on ZMQ: if a socket's queue is full (the peer is slow
+    or not up yet) the message goes to a per-endpoint backlog that a drain
+    thread delivers in order once the socket polls writable. The drain
+    thread runs only while a backlog exists. Once a backlog reaches
+    SEND_BACKLOG_SIZE, senders to that endpoint wait for the drain thread
+    to make room, so memory stays bounded; other endpoints are unaffected.
+    """
+
+    SEND_BACKLOG_SIZE = 10000
+    # Longest drain-thread poll before it picks up new or disconnected backlogs
+    DRAIN_POLL_MS = 100
+
+    def __init__(
+        self,
+        context: Optional[zmq.Context] = None,
+        local_endpoint: Optional[str] = None,
+        binary: bool = False
+    ):
+        if binary and not wire.HAVE_MSGPACK:
+            raise ValueError("binary=True requires msgpack to be installed")
         self._context = context or zmq.Context.instance()
-        self._sockets: Dict[str, zmq.Socket] = {}
         self._local_endpoint = local_endpoint  # This process's endpoint for replies
+        self._binary = binary
+
+        # Manager whose ZmqReceiver listens on local_endpoint; set by ZmqReceiver
+        self._local_manager: Optional['Manager'] = None
+
+        # Guards the endpoint map, the draining set and the drain thread; held
+        # only briefly, never across a send. Each _Endpoint has its own lock.
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, _Endpoint] = {}
+        # Endpoints whose backlog the drain thread is delivering
+        self._draining: Set[_Endpoint] = set()
+        self._drain_thread: Optional[threading.Thread] = None
 
     def set_local_endpoint(self, endpoint: str) -> None:
         """Set the local endpoint for reply routing."""
         self._local_endpoint = endpoint
 
-    def _get_socket(self, endpoint: str) -> zmq.Socket:
-        """Get or create a PUSH socket for the given endpoint."""
-        if endpoint not in self._sockets:
-            socket = self._context.socket(zmq.PUSH)
-            socket.connect(endpoint)
-            self._sockets[endpoint] = socket
-        return self._sockets[endpoint]
+    def set_local_manager(self, manager: 'Manager') -> None:
+        """Deliver messages addressed to local_endpoint straight to manager.
+
+        Messages for an actor in this process then skip serialization and
+        the socket round trip and are put in the actor's mailbox as-is, so
+        the receiver gets the sender's message object rather than a copy.
+        """
+        self._local_manager = manager
+
+    def _local_ref(self, endpoint: str, actor_name: str) -> Optional[ActorRef]:
+        """Return the in-process ref for actor_name if endpoint is this process."""
+        if self._local_manager is None or endpoint != self._local_endpoint:
+            return None
+        return self._local_manager.get_ref(actor_name)
+
+    def _get_endpoint(self, endpoint: str) -> _Endpoint:
+        """Get or create the PUSH socket and backlog for the given endpoint."""
+        with self._lock:
+            state = self._endpoints.get(endpoint)
+            if state is None:
+                socket = self._context.socket(zmq.PUSH)
+                socket.connect(endpoint)
+                state = self._endpoints[endpoint] = _Endpoint(socket)
+            return state
+
+    def _sender_info(self, sender: Optional[ActorRef]) -> Tuple[Optional[str], Optional[str]]:
+        """Return (sender_actor, sender_endpoint) for reply routing."""
+        sender_actor = sender.name if sender else None
+
+        # Get sender endpoint - could be local or remote
+        if sender and isinstance(sender, RemoteActorRef):
+            sender_endpoint = sender.endpoint
+        else:
+            sender_endpoint = self._local_endpoint
+        return sender_actor, sender_endpoint
+
+    def _encode(self, actor_name: str, msg: Any, sender: Optional[ActorRef]) -> bytes:
+        """Serialize and encode one message for a remote actor."""
+        data = serialize_message(actor_name, msg, *self._sender_info(sender))
+        return wire.encode(data, self._binary)
 
     def send_to(
         self,
@@ -70,51 +160,193 @@ class ZmqSender:
         sender: Optional[ActorRef]
     ) -> None:
         """Send a message to a remote actor."""
-        # Determine sender info for reply routing
-        sender_actor = sender.name if sender else None
+        local_ref = self._local_ref(endpoint, actor_name)
+        if local_ref is not None:
+            local_ref.send(msg, sender)
+            return
+        self._send(endpoint, [self._encode(actor_name, msg, sender)])
 
-        # Get sender endpoint - could be local or remote
-        if sender and isinstance(sender, RemoteActorRef):
-            sender_endpoint = sender.endpoint
+    def send_batch(
+        self,
+        endpoint: str,
+        actor_name: str,
+        msgs: Iterable[Any],
+        sender: Optional[ActorRef]
+    ) -> None:
+        """Send several messages to a remote actor in one multipart ZMQ message.
+
+        Each frame is an ordinary single-message envelope, so the receiver
+        delivers them in order as if they had been sent one by one. Python
+        and C++ receivers read every frame; the Rust receiver only reads the
+        first, so use send_to() when talking to Rust.
+
+        With binary=True (Python peers only) a batch whose messages all share
+        one type is packed into a single frame instead, so the envelope fields
+        are encoded and decoded once for the whole batch.
+        """
+        local_ref = self._local_ref(endpoint, actor_name)
+        if local_ref is not None:
+            for msg in msgs:
+                local_ref.send(msg, sender)
+            return
+        msgs = list(msgs)
+        if not msgs:
+            return
+        if self._binary and len(msgs) > 1 and len({type(msg) for msg in msgs}) == 1:
+            data = serialize_batch(actor_name, msgs, *self._sender_info(sender))
+            frames = [wire.encode(data, True)]
         else:
-            sender_endpoint = self._local_endpoint
-
-        socket = self._get_socket(endpoint)
-        data = serialize_message(actor_name, msg, sender_actor, sender_endpoint)
-        socket.send_json(data)
+            frames = [self._encode(actor_name, msg, sender) for msg in msgs]
+        self._send(endpoint, frames)
+
+    def _send(self, endpoint: str, frames: List[bytes]) -> None:
+        """Send frames without blocking, backlogging them if ZMQ is full."""
+        state = self._get_endpoint(endpoint)
+        with state.cond:
+            if not state.backlog:
+                if state.closed:
+                    return  # raced a disconnect(); dropped like its backlog
+                try:
+                    state.socket.send_multipart(frames, zmq.NOBLOCK)
+                    return
+                except zmq.Again:
+                    pass
+            else:
+                # Back-pressure: wait for the drain thread to make room
+                while len(state.backlog) >= self.SEND_BACKLOG_SIZE and not state.closed:
+                    state.cond.wait()
+                if state.closed:
+                    return
+            # Queue behind earlier backlogged messages to keep ordering
+            state.backlog.append(frames)
+            if len(state.backlog) == 1:
+                self._start_draining(state)
+
+    def _start_draining(self, state: _Endpoint) -> None:
+        """Hand an endpoint's socket to the drain thread, starting it if needed."""
+        with self._lock:
+            self._draining.add(state)
+            if self._drain_thread is None:
+                self._drain_thread = threading.Thread(
+                    target=self._drain_backlogs,
+                    daemon=True,
+                    name="zmq-sender-drain"
+                )
+                self._drain_thread.start()
+
+    def _drain_backlogs(self) -> None:
+        """Drain thread: deliver backlogs as their sockets become writable."""
+        while True:
+            with self._lock:
+                if not self._draining:
+                    self._drain_thread = None
+                    return
+                states = list(self._draining)
+
+            # Only this thread touches a draining socket, so it can poll
+            # without holding the endpoint's lock
+            poller = zmq.Poller()
+            for state in states:
+                if not state.closed:
+                    poller.register(state.socket, zmq.POLLOUT)
+            timeout = 0 if any(state.closed for state in states) else self.DRAIN_POLL_MS
+            ready = dict(poller.poll(timeout))
+
+            for state in states:
+                with state.cond:
+                    if state.closed:
+                        state.socket.close()
+                    elif state.socket in ready:
+                        while state.backlog:
+                            try:
+                                state.socket.send_multipart(state.backlog[0], zmq.NOBLOCK)
+                            except zmq.Again:
+                                break
+                            state.backlog.popleft()
+                        state.cond.notify_all()
+                    if state.closed or not state.backlog:
+                        # Senders own the socket again
+                        with self._lock:
+                            self._draining.discard(state)
+
+    def pending(self) -> int:
+        """Number of messages waiting in backlogs."""
+        with self._lock:
+            return sum(len(state.backlog) for state in self._draining)
+
+    def _close_endpoint(self, state: _Endpoint) -> None:
+        """Close an endpoint's socket, discarding its backlog."""
+        with state.cond:
+            state.closed = True
+            state.cond.notify_all()
+            if state.backlog:
+                # The drain thread owns the socket and closes it
+                state.backlog.clear()
+            else:
+                state.socket.close()
+
+    def disconnect(self, endpoint: str) -> None:
+        """Close the cached socket for an endpoint, discarding its backlog.
+
+        Use this when a remote process has gone away or moved (for example
+        after RegistryClient.invalidate()); the next send to the endpoint
+        connects a fresh socket. Senders waiting on the endpoint's full
+        backlog return and their messages are dropped.
+        """
+        with self._lock:
+            state = self._endpoints.pop(endpoint, None)
+        if state is not None:
+            self._close_endpoint(state)
 
     def close(self) -> None:
-        """Close all sockets."""
-        for socket in self._sockets.values():
-            socket.close()
-        self._sockets.clear()
+        """Close all sockets, discarding any backlogged messages."""
+        with self._lock:
+            states = list(self._endpoints.values())
+            self._endpoints.clear()
+        for state in states:
+            self._close_endpoint(state)
 
 
 class ZmqReceiver(Actor):
     """Receives messages from remote processes and routes to local actors."""
 
-    def __init__(self, bind_endpoint: str, manager: 'Manager', zmq_sender: ZmqSender):
+    # Longest wait for remote traffic before the local queue is checked
+    POLL_TIMEOUT_MS = 10
+    # Most remote messages handled per wakeup before the local queue (and a
+    # pending Shutdown) gets a turn
+    RECV_BATCH_SIZE = 256
+
+    def __init__(
+        self,
+        bind_endpoint: str,
+        manager: 'Manager',
+        zmq_sender: ZmqSender,
+        context: Optional[zmq.Context] = None
+    ):
         self._bind_endpoint = bind_endpoint
         self._manager = manager
         self._zmq_sender = zmq_sender
+        # Share the sender's context so the process runs one set of I/O threads
+        self._context = context or zmq_sender._context
         self._zmq_socket: Optional[zmq.Socket] = None
+        # Sends to this process's own endpoint can bypass the socket
+        zmq_sender.set_local_manager(manager)
 
     def init(self) -> None:
         """Bind ZMQ socket."""
-        context = zmq.Context.instance()
-        self._zmq_socket = context.socket(zmq.PULL)
+        self._zmq_socket = self._context.socket(zmq.PULL)
         self._zmq_socket.bind(self._bind_endpoint)
 
     def run(self) -> None:
         """Override: poll both ZMQ and local queue."""
         self.init()
+        poller = zmq.Poller()
+        poller.register(self._zmq_socket, zmq.POLLIN)
         while self._running:
-            # Check ZMQ (non-blocking)
-            try:
-                data = self._zmq_socket.recv_json(flags=zmq.NOBLOCK)
-                self._handle_remote_message(data)
-            except zmq.Again:
-                pass
+            # Block until a remote message arrives (or the timeout passes,
+            # so the local queue is still checked regularly)
+            if poller.poll(self.POLL_TIMEOUT_MS):
+                self._drain_socket()
 
             # Check local queue for Shutdown message
             try:
@@ -123,10 +355,20 @@ class ZmqReceiver(Actor):
             except Empty:
                 pass
 
-            time.sleep(0.001)  # Small sleep to avoid busy-waiting
-
         self.end()
 
+    def _drain_socket(self) -> None:
+        """Handle queued remote messages, up to RECV_BATCH_SIZE per wakeup."""
+        recv_multipart = self._zmq_socket.recv_multipart
+        for _ in range(self.RECV_BATCH_SIZE):
+            try:
+                # A batch from send_batch() arrives as one multipart message
+                frames = recv_multipart(flags=zmq.NOBLOCK)
+            except zmq.Again:
+                return
+            for frame in frames:
+                self._handle_remote_message(wire.decode(frame))
+
     def end(self) -> None:
         """Close ZMQ socket."""
         if self._zmq_socket:
@@ -159,16 +401,20 @@ class ZmqReceiver(Actor):
                 sender_ref.send(reject, sender=None)
             return
 
+        # A packed batch from send_batch() lists its bodies under "messages"
+        payloads = data["messages"] if "messages" in data else (data["message"],)
+
         # Try to deserialize and deliver
-        try:
-            msg = deserialize_message(msg_type, data["message"])
-            local_ref.send(msg, sender=sender_ref)
-        except ValueError as e:
-            # Deserialization failed - send reject back to sender
-            if sender_ref:
-                reject = Reject(
-                    message_type=msg_type,
-                    reason=str(e),
-                    rejected_by=receiver_name
-                )
-                sender_ref.send(reject, sender=None)
+        for payload in payloads:
+            try:
+                msg = deserialize_message(msg_type, payload)
+                local_ref.send(msg, sender=sender_ref)
+            except ValueError as e:
+                # Deserialization failed - send reject back to sender
+                if sender_ref:
+                    reject = Reject(
+                        message_type=msg_type,
+                        reason=str(e),
+                        rejected_by=receiver_name
+                    )
+                    sender_ref.send(reject, sender=None)
@@ -6,7 +6,7 @@ THIS SOFTWARE IS OPEN SOURCE UNDER THE MIT LICENSE
 Copyright 2025 Vincent Maciejewski, & M2 Tech
 """
 
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, List, Optional, Type
 
 # Registry of message types for deserialization
 MESSAGE_REGISTRY: Dict[str, Type] = {}
@@ -34,6 +34,26 @@ def serialize_message(
     }
 
 
+def serialize_batch(
+    receiver: str,
+    msgs: List[Any],
+    sender_actor: Optional[str],
+    sender_endpoint: Optional[str]
+) -> dict:
+    """Serialize messages of one type as a single envelope.
+
+    The routing fields and message_type are written once and the message
+    bodies are listed under "messages".
+    """
+    return {
+        "sender_actor": sender_actor,
+        "sender_endpoint": sender_endpoint,
+        "receiver": receiver,
+        "message_type": type(msgs[0]).__name__,
+        "messages": [msg.__dict__ if hasattr(msg, '__dict__') else {} for msg in msgs]
+    }
+
+
 def deserialize_message(msg_type: str, data: dict) -> Any:
     """Deserialize a message from remote transmission."""
     cls = MESSAGE_REGISTRY.get(msg_type)
@@ -0,0 +1,67 @@
+"""
+Wire codecs for registry and remote actor traffic.
+
+Messages travel as plain dicts keyed by 'message_type'. Registry traffic is
+encoded with msgpack when it is installed and with JSON otherwise; remote
+actor traffic is JSON unless a ZmqSender opts into msgpack. Decoding sniffs
+the first byte so JSON peers (the C++ and Rust runtimes) and msgpack peers
+can share one registry or receiver.
+
+THIS SOFTWARE IS OPEN SOURCE UNDER THE MIT LICENSE
+Copyright 2025 Vincent Maciejewski, & M2 Tech
+"""
+
+import json
+from typing import Any, Tuple
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional - fall back to JSON
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to the stdlib encoder
+    orjson = None
+
+HAVE_MSGPACK = msgpack is not None
+
+# A JSON object always starts with '{' (optionally after whitespace);
+# a msgpack map never does.
+_JSON_LEAD_BYTES = frozenset(b'{ \t\r\n')
+
+
+def is_json(data: bytes) -> bool:
+    """Return True if an encoded message is JSON rather than msgpack."""
+    return not data or data[0] in _JSON_LEAD_BYTES
+
+
+def encode_json(msg: Any) -> bytes:
+    """Encode a message dict as UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(msg)
+    return json.dumps(msg).encode('utf-8')
+
+
+def encode(msg: Any, binary: bool = HAVE_MSGPACK) -> bytes:
+    """Encode a message dict, as msgpack if binary else JSON."""
+    if binary:
+        return msgpack.packb(msg, use_bin_type=True)
+    return encode_json(msg)
+
+
+def decode_with_format(data: bytes) -> Tuple[Any, bool]:
+    """Decode a message and report whether it was binary (msgpack).
+
+    Servers use the flag to reply in the same format the peer spoke.
+    """
+    if is_json(data):
+        return json.loads(data.decode('utf-8')), False
+    if msgpack is None:
+        raise ValueError("Received msgpack data but msgpack is not installed")
+    return msgpack.unpackb(data, raw=False), True
+
+
+def decode(data: bytes) -> Any:
+    """Decode a message dict, detecting JSON vs msgpack from the first byte."""
+    return decode_with_format(data)[0]
@@ -14,19 +14,24 @@ THIS SOFTWARE IS OPEN SOURCE UNDER THE MIT LICENSE
 Copyright 2025 Vincent Maciejewski, & M2 Tech
 """
 
-import sys
-sys.path.insert(0, '/home/vm/actors-py')
+import os
 
 from actors import Actor, ActorRef, Envelope, Manager, ManagerHandle, Start
 
+VERBOSE = os.environ.get("ACTORS_VERBOSE") == "1"  # see python/README.md
+
 
 # Custom messages
 class Ping:
+    __slots__ = ('count',)
+
     def __init__(self, count: int):
         self.count = count
 
 
 class Pong:
+    __slots__ = ('count',)
+
     def __init__(self, count: int):
         self.count = count
 
@@ -43,7 +48,8 @@ class PingActor(Actor):
         self.pong_ref.send(Ping(1), self._actor_ref)
 
     def on_pong(self, env: Envelope) -> None:
-        print(f"PingActor: Received pong {env.msg.count}")
+        if VERBOSE:
+            print(f"PingActor: Received pong {env.msg.count}")
         if env.msg.count >= 5:
             print("PingActor: Done!")
             self.manager_handle.terminate()
@@ -55,7 +61,8 @@ class PongActor(Actor):
     """Receives Ping, sends Pong."""
 
     def on_ping(self, env: Envelope) -> None:
-        print(f"PongActor: Received ping {env.msg.count}, sending pong")
+        if VERBOSE:
+            print(f"PongActor: Received ping {env.msg.count}, sending pong")
         self.reply(env, Pong(env.msg.count))
 
 
@@ -6,16 +6,14 @@ This example demonstrates error handling when a remote message type is unknown.
 The receiver only knows about Ping/Pong, not UnknownMessage.
 
 Run this first, then run sender:
-    python examples/reject_example/receiver.py
+    PYTHONPATH=. python examples/reject_example/receiver.py
 
 THIS SOFTWARE IS OPEN SOURCE UNDER THE MIT LICENSE
 
 Copyright 2025 Vincent Maciejewski, & M2 Tech
 """
 
-import sys
 import signal
-sys.path.insert(0, '/home/vm/actors-py')
 
 from actors import (
     Actor, Envelope, Manager,
@@ -7,16 +7,13 @@ The sender sends a message that the receiver doesn't know about, and receives
 a Reject message back.
 
 Run receiver first, then run this:
-    python examples/reject_example/sender.py
+    PYTHONPATH=. python examples/reject_example/sender.py
 
 THIS SOFTWARE IS OPEN SOURCE UNDER THE MIT LICENSE
 
 Copyright 2025 Vincent Maciejewski, & M2 Tech
 """
 
-import sys
-sys.path.insert(0, '/home/vm/actors-py')
-
 from actors import (
     Actor, Envelope, Manager, Start, Reject,
     RemoteActorRef, ZmqSender, ZmqReceiver,
@@ -5,23 +5,22 @@ Remote Ping-Pong: Ping Process
 Run pong_process.py first, then run this.
 
 Usage:
-    python ping_process.py
+    PYTHONPATH=. python examples/remote_ping_pong/ping_process.py
 
 THIS SOFTWARE IS OPEN SOURCE UNDER THE MIT LICENSE
 
 Copyright 2025 Vincent Maciejewski, & M2 Tech
 """
 
-import sys
 import os
-# Add the parent python directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from actors import (
     Actor, Envelope, Manager, ManagerHandle, Start,
     RemoteActorRef, ZmqSender, ZmqReceiver, register_message
 )
 
+VERBOSE = os.environ.get("ACTORS_VERBOSE") == "1"  # see python/README.md
+
 
 # Register messages for serialization
 @register_message
@@ -48,7 +47,8 @@ class PingActor(Actor):
         self.pong_ref.send(Ping(1), self._actor_ref)
 
     def on_pong(self, env: Envelope) -> None:
-        print(f"PingActor: Received pong {env.msg.count} from remote")
+        if VERBOSE:
+            print(f"PingActor: Received pong {env.msg.count} from remote")
         if env.msg.count >= 5:
             print("PingActor: Done!")
             self.manager_handle.terminate()
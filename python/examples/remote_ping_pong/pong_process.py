@@ -5,23 +5,22 @@ Remote Ping-Pong: Pong Process
 Run this first, then run ping_process.py in another terminal.
 
 Usage:
-    python pong_process.py
+    PYTHONPATH=. python examples/remote_ping_pong/pong_process.py
 
 THIS SOFTWARE IS OPEN SOURCE UNDER THE MIT LICENSE
 
 Copyright 2025 Vincent Maciejewski, & M2 Tech
 """
 
-import sys
 import os
-# Add the parent python directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from actors import (
     Actor, Envelope, Manager,
     ZmqSender, ZmqReceiver, register_message
 )
 
+VERBOSE = os.environ.get("ACTORS_VERBOSE") == "1"  # see python/README.md
+
 
 # Register messages for serialization
 @register_message
@@ -40,7 +39,8 @@ class PongActor(Actor):
     """Receives Ping from remote, sends Pong back."""
 
     def on_ping(self, env: Envelope) -> None:
-        print(f"PongActor: Received ping {env.msg.count} from {env.sender.name}")
+        if VERBOSE:
+            print(f"PongActor: Received ping {env.msg.count} from {env.sender.name}")
         self.reply(env, Pong(env.msg.count))
 
 
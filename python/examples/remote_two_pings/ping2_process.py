@@ -7,21 +7,22 @@ Second ping process - sends pings to shared pong.
 Run pong_process.py first, then run this and ping1_process.py.
 
 Usage:
-    python ping2_process.py
+    PYTHONPATH=. python examples/remote_two_pings/ping2_process.py
 
 THIS SOFTWARE IS OPEN SOURCE UNDER THE MIT LICENSE
 
 Copyright 2025 Vincent Maciejewski, & M2 Tech
 """
 
-import sys
-sys.path.insert(0, '/home/vm/actors-py')
+import os
 
 from actors import (
     Actor, Envelope, Manager, ManagerHandle, Start,
     RemoteActorRef, ZmqSender, ZmqReceiver, register_message
 )
 
+VERBOSE = os.environ.get("ACTORS_VERBOSE") == "1"  # see python/README.md
+
 
 # Register messages for serialization
 @register_message
@@ -51,7 +52,8 @@ class PingActor(Actor):
         self.pong_ref.send(Ping(1, self.my_name), self._actor_ref)
 
     def on_pong(self, env: Envelope) -> None:
-        print(f"{self.my_name}: Received pong {env.msg.count}")
+        if VERBOSE:
+            print(f"{self.my_name}: Received pong {env.msg.count}")
         if env.msg.count >= 3:
             print(f"{self.my_name}: Done!")
             self.manager_handle.terminate()
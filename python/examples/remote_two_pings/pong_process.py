@@ -7,21 +7,22 @@ Handles pings from two different processes and routes replies correctly.
 Run this first, then run ping1_process.py and ping2_process.py.
 
 Usage:
-    python pong_process.py
+    PYTHONPATH=. python examples/remote_two_pings/pong_process.py
 
 THIS SOFTWARE IS OPEN SOURCE UNDER THE MIT LICENSE
 
 Copyright 2025 Vincent Maciejewski, & M2 Tech
 """
 
-import sys
-sys.path.insert(0, '/home/vm/actors-py')
+import os
 
 from actors import (
     Actor, Envelope, Manager,
     ZmqSender, ZmqReceiver, register_message
 )
 
+VERBOSE = os.environ.get("ACTORS_VERBOSE") == "1"  # see python/README.md
+
 
 # Register messages for serialization
 @register_message
@@ -43,7 +44,8 @@ class PongActor(Actor):
 
     def on_ping(self, env: Envelope) -> None:
         sender_name = env.sender.name if env.sender else "unknown"
-        print(f"PongActor: Received ping {env.msg.count} from {sender_name} (source={env.msg.source})")
+        if VERBOSE:
+            print(f"PongActor: Received ping {env.msg.count} from {sender_name} (source={env.msg.source})")
         # Reply goes back to correct sender via RemoteActorRef
         self.reply(env, Pong(env.msg.count, env.msg.source))
 
@@ -12,9 +12,6 @@ THIS SOFTWARE IS OPEN SOURCE UNDER THE MIT LICENSE
 Copyright 2025 Vincent Maciejewski, & M2 Tech
 """
 
-import sys
-sys.path.insert(0, '/home/vm/actors-py')
-
 from actors import (
     Actor, Envelope, Manager, Start,
     Timer, Timeout, next_timer_id
@@ -1,8 +1,11 @@
 """Tests for Actor, ActorRef, LocalActorRef, and Envelope."""
 
+import threading
+
 import pytest
-from queue import Queue
-from actors.actor import Actor, Envelope, LocalActorRef
+from queue import Queue, Empty
+from actors import actor as actor_module
+from actors.actor import Actor, Envelope, FastMailbox, LocalActorRef
 
 
 class TestEnvelope:
@@ -29,6 +32,47 @@ class TestEnvelope:
         assert env.reply_queue is reply_q
 
 
+class TestFastMailbox:
+    """Tests for the deque-based actor mailbox."""
+
+    def test_fifo_order(self):
+        """Items come out in the order they were put."""
+        mailbox = FastMailbox()
+        for i in range(3):
+            mailbox.put(i)
+
+        assert mailbox.qsize() == 3
+        assert [mailbox.get_nowait() for _ in range(3)] == [0, 1, 2]
+        assert mailbox.empty()
+
+    def test_get_times_out_when_empty(self):
+        """get() raises Empty after the timeout, get_nowait() immediately."""
+        mailbox = FastMailbox()
+
+        with pytest.raises(Empty):
+            mailbox.get(timeout=0.01)
+        with pytest.raises(Empty):
+            mailbox.get_nowait()
+
+    def test_get_wakes_on_put_from_other_thread(self):
+        """A blocked get() returns once another thread puts an item."""
+        mailbox = FastMailbox()
+        timer = threading.Timer(0.05, mailbox.put, args=("hello",))
+        timer.start()
+
+        assert mailbox.get(timeout=1.0) == "hello"
+        timer.join()
+
+    def test_local_actor_ref_sends_to_mailbox(self):
+        """LocalActorRef accepts a FastMailbox in place of a Queue."""
+        mailbox = FastMailbox()
+        ref = LocalActorRef(mailbox, "receiver")
+
+        ref.send("hello")
+
+        assert mailbox.get_nowait().msg == "hello"
+
+
 class TestLocalActorRef:
     """Tests for LocalActorRef."""
 
@@ -63,13 +107,27 @@ class TestLocalActorRef:
         env = queue.get_nowait()
         assert env.sender is sender_ref
 
+    def test_send_reuses_recycled_envelope(self, monkeypatch):
+        """With the envelope pool enabled, processed envelopes are reused."""
+        monkeypatch.setattr(actor_module, "ENVELOPE_POOL_ENABLED", True)
+        monkeypatch.setattr(actor_module, "_envelope_pool", [])
+        queue = Queue()
+        ref = LocalActorRef(queue, "receiver")
+
+        ref.send("first")
+        env = queue.get_nowait()
+        actor_module._recycle_envelope(env)
+        assert env.msg is None
+
+        ref.send("second")
+        assert queue.get_nowait() is env
+        assert env.msg == "second"
+
     def test_fast_send_returns_reply(self):
         """fast_send() waits for reply and returns it."""
         queue = Queue()
         ref = LocalActorRef(queue, "receiver")
 
-        import threading
-
         def responder():
             env = queue.get()
             assert env.reply_queue is not None
@@ -82,6 +140,46 @@ class TestLocalActorRef:
         assert result == "response"
         thread.join()
 
+    def test_fast_send_reuses_reply_queue(self):
+        """Successive fast_send calls on a thread share one reply queue."""
+        queue = Queue()
+        ref = LocalActorRef(queue, "receiver")
+        reply_queues = []
+
+        def responder():
+            for reply in ("first", "second"):
+                env = queue.get()
+                reply_queues.append(env.reply_queue)
+                env.reply_queue.put(reply)
+
+        thread = threading.Thread(target=responder)
+        thread.start()
+
+        assert ref.fast_send("request") == "first"
+        assert ref.fast_send("request") == "second"
+        thread.join()
+        assert reply_queues[0] is reply_queues[1]
+
+    def test_fast_send_discards_queue_with_stray_reply(self):
+        """A leftover reply from a previous call is never returned."""
+        queue = Queue()
+        ref = LocalActorRef(queue, "receiver")
+
+        def responder(replies):
+            env = queue.get()
+            for reply in replies:
+                env.reply_queue.put(reply)
+
+        thread = threading.Thread(target=responder, args=(("first", "stray"),))
+        thread.start()
+        assert ref.fast_send("request") == "first"
+        thread.join()
+
+        thread = threading.Thread(target=responder, args=(("second",),))
+        thread.start()
+        assert ref.fast_send("request") == "second"
+        thread.join()
+
 
 class TestActor:
     """Tests for Actor base class."""
@@ -105,6 +203,65 @@ class TestActor:
 
         assert isinstance(actor.received, Ping)
 
+    def test_subclass_overrides_cached_handler(self):
+        """Handlers are cached per class, so subclasses keep their overrides."""
+        class Ping:
+            pass
+
+        class BaseActor(Actor):
+            def on_ping(self, env):
+                self.handled_by = "base"
+
+        class DerivedActor(BaseActor):
+            def on_ping(self, env):
+                self.handled_by = "derived"
+
+        base, derived = BaseActor(), DerivedActor()
+        for _ in range(2):
+            base.process_message(Envelope(msg=Ping()))
+            derived.process_message(Envelope(msg=Ping()))
+
+        assert base.handled_by == "base"
+        assert derived.handled_by == "derived"
+
+    def test_instance_handler_is_used(self):
+        """Handlers assigned on the instance win, as with plain getattr."""
+        class Ping:
+            pass
+
+        class ClassHandlerActor(Actor):
+            def on_ping(self, env):
+                self.handled_by = "class"
+
+        seen = []
+        plain, shadowed = Actor(), ClassHandlerActor()
+        plain.on_ping = seen.append
+        ClassHandlerActor().process_message(Envelope(msg=Ping()))
+        shadowed.on_ping = seen.append
+        for actor in (plain, shadowed):
+            actor.process_message(Envelope(msg=Ping()))
+
+        assert len(seen) == 2
+        assert not hasattr(shadowed, "handled_by")
+
+    def test_staticmethod_handler_gets_envelope_only(self):
+        """A staticmethod handler is called with just the envelope."""
+        class Ping:
+            pass
+
+        seen = []
+
+        class StaticActor(Actor):
+            @staticmethod
+            def on_ping(env):
+                seen.append(env)
+
+        env = Envelope(msg=Ping())
+        for _ in range(2):
+            StaticActor().process_message(env)
+
+        assert seen == [env, env]
+
     def test_process_message_ignores_unknown(self):
         """process_message silently ignores unknown message types."""
         class Unknown:
@@ -1,9 +1,10 @@
 """Tests for Manager and ManagerHandle."""
 
+import threading
+
 import pytest
 import time
-from queue import Queue
-from actors.actor import Actor, Envelope
+from actors.actor import Actor, Envelope, FastMailbox
 from actors.manager import Manager, ManagerHandle
 from actors.messages import Start, Shutdown
 
@@ -22,6 +23,18 @@ class TestManagerHandle:
         handle.terminate()
         assert handle.is_terminated() is True
 
+    def test_run_returns_when_terminated_from_another_thread(self):
+        """Manager.run() wakes promptly when terminate() is called."""
+        mgr = Manager()
+        timer = threading.Timer(0.05, mgr.get_handle().terminate)
+        start = time.monotonic()
+        timer.start()
+
+        mgr.run()
+
+        assert time.monotonic() - start < 0.5
+        timer.join()
+
 
 class TestManager:
     """Tests for Manager."""
@@ -42,7 +55,7 @@ class TestManager:
         mgr.manage("test", actor)
 
         assert actor._queue is not None
-        assert isinstance(actor._queue, Queue)
+        assert isinstance(actor._queue, FastMailbox)
 
     def test_get_ref_returns_managed_actor(self):
         """get_ref() returns the actor's reference."""
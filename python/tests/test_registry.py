@@ -1,9 +1,16 @@
 """Tests for GlobalRegistry (without ZMQ)."""
 
+import json
 import pytest
+import threading
 import time
 from unittest.mock import patch
-from actors.registry import GlobalRegistry, ActorEntry
+from actors import Manager, wire
+from actors.registry import (
+    GlobalRegistry, ActorEntry, _do_register, _do_unregister, _do_lookup,
+    _do_lookup_many, _process_request, _process_heartbeat_datagram
+)
+from actors.registry_messages import RegistrationOk, RegistrationFailed, StartManager
 
 
 class TestGlobalRegistryState:
@@ -12,8 +19,8 @@ class TestGlobalRegistryState:
     def test_initial_state_empty(self):
         """Registry starts with no actors registered."""
         registry = GlobalRegistry()
-        assert registry.get_all_actors() == []
-        assert registry.get_all_managers() == []
+        assert registry.get_all_actors() == ()
+        assert registry.get_all_managers() == ()
 
     def test_lookup_returns_none_for_unknown(self):
         """lookup() returns None for unregistered actors."""
@@ -52,6 +59,157 @@ class TestGlobalRegistryState:
         assert registry.is_manager_online("mgr1") is False
 
 
+class TestRegistryOperations:
+    """Tests for the register/unregister/lookup operations."""
+
+    def test_register_adds_actor(self):
+        """_do_register records the actor and counts as a heartbeat."""
+        registry = GlobalRegistry()
+        reply = _do_register(registry, "mgr1", "pong", "tcp://host:5001", time.monotonic())
+
+        assert isinstance(reply, RegistrationOk)
+        assert registry.lookup("pong") == "tcp://host:5001"
+        assert registry._manager_actors["mgr1"] == {"pong"}
+        assert registry.is_manager_online("mgr1") is True
+
+    def test_snapshots_track_membership_changes(self):
+        """get_all_actors/get_all_managers reflect register and unregister."""
+        registry = GlobalRegistry()
+        assert registry.get_all_actors() == ()
+
+        _do_register(registry, "mgr1", "pong", "tcp://host:5001", time.monotonic())
+        assert registry.get_all_actors() == ("pong",)
+        assert registry.get_all_managers() == ("mgr1",)
+        assert registry.get_all_actors() is registry.get_all_actors()
+
+        _do_unregister(registry, "pong")
+        assert registry.get_all_actors() == ()
+
+        registry._unregister_manager("mgr1")
+        assert registry.get_all_managers() == ()
+
+    def test_register_duplicate_fails(self):
+        """_do_register rejects a name that is already registered."""
+        registry = GlobalRegistry()
+        _do_register(registry, "mgr1", "pong", "tcp://host:5001", time.monotonic())
+        reply = _do_register(registry, "mgr2", "pong", "tcp://host:6001", time.monotonic())
+
+        assert isinstance(reply, RegistrationFailed)
+        assert registry.lookup("pong") == "tcp://host:5001"
+        assert "mgr2" not in registry._manager_actors
+
+    def test_unregister_removes_actor(self):
+        """_do_unregister removes the actor from the registry."""
+        registry = GlobalRegistry()
+        _do_register(registry, "mgr1", "pong", "tcp://host:5001", time.monotonic())
+
+        assert _do_unregister(registry, "pong") is True
+        assert _do_unregister(registry, "pong") is False
+        assert registry.lookup("pong") is None
+        assert registry._manager_actors["mgr1"] == set()
+
+    def test_lookup_reports_online_status(self):
+        """_do_lookup returns endpoint and online flag."""
+        registry = GlobalRegistry()
+        _do_register(registry, "mgr1", "pong", "tcp://host:5001", time.monotonic())
+
+        found = _do_lookup(registry, "pong", time.monotonic())
+        assert found.endpoint == "tcp://host:5001"
+        assert found.online is True
+
+        missing = _do_lookup(registry, "unknown", time.monotonic())
+        assert missing.endpoint is None
+        assert missing.online is False
+
+    def test_lookup_many(self):
+        """_do_lookup_many resolves every requested name."""
+        registry = GlobalRegistry()
+        _do_register(registry, "mgr1", "pong", "tcp://host:5001", time.monotonic())
+
+        reply = _do_lookup_many(registry, ["pong", "unknown"], time.monotonic())
+
+        assert reply.results == {
+            "pong": ("tcp://host:5001", True),
+            "unknown": (None, False),
+        }
+
+
+class TestProcessRequest:
+    """Tests for raw request handling used by run_registry."""
+
+    def test_heartbeat_returns_ack_and_records(self):
+        """Heartbeats are acked and recorded."""
+        registry = GlobalRegistry()
+        request = wire.encode({"message_type": "Heartbeat", "manager_id": "mgr1"}, binary=False)
+
+        reply = wire.decode(_process_request(registry, request))
+
+        assert reply == {"message_type": "HeartbeatAck"}
+        assert registry.is_manager_online("mgr1") is True
+
+    def test_batch_heartbeat_records_all_managers(self):
+        """A BatchHeartbeat refreshes every listed manager."""
+        registry = GlobalRegistry()
+        request = wire.encode(
+            {"message_type": "BatchHeartbeat", "manager_ids": ["mgr1", "mgr2"]},
+            binary=False
+        )
+
+        reply = wire.decode(_process_request(registry, request))
+
+        assert reply["message_type"] == "HeartbeatAck"
+        assert registry.is_manager_online("mgr1") is True
+        assert registry.is_manager_online("mgr2") is True
+
+    def test_reply_echoes_corr_id(self):
+        """Replies carry the request's corr_id back to the client."""
+        registry = GlobalRegistry()
+        request = wire.encode(
+            {"message_type": "LookupActor", "actor_name": "pong", "corr_id": 7},
+            binary=False
+        )
+
+        reply = wire.decode(_process_request(registry, request))
+
+        assert reply["message_type"] == "LookupResult"
+        assert reply["corr_id"] == 7
+
+    def test_unknown_message_type(self):
+        """Unknown message types get an error reply."""
+        registry = GlobalRegistry()
+        request = wire.encode({"message_type": "Bogus"}, binary=False)
+
+        reply = wire.decode(_process_request(registry, request))
+
+        assert "error" in reply
+
+
+class TestHeartbeatDatagram:
+    """Tests for UDP heartbeat datagrams."""
+
+    def test_batch_heartbeat_datagram_records_managers(self):
+        """A BatchHeartbeat datagram refreshes every listed manager."""
+        registry = GlobalRegistry()
+        data = wire.encode({"message_type": "BatchHeartbeat", "manager_ids": ["mgr1", "mgr2"]})
+
+        _process_heartbeat_datagram(registry, data)
+
+        assert registry.is_manager_online("mgr1") is True
+        assert registry.is_manager_online("mgr2") is True
+
+    def test_malformed_datagram_is_dropped(self):
+        """Garbage and non-heartbeat datagrams are ignored."""
+        registry = GlobalRegistry()
+
+        _process_heartbeat_datagram(registry, b"{not json")
+        _process_heartbeat_datagram(registry, b'{"message_type": "Heartbeat"}')
+        _process_heartbeat_datagram(
+            registry, wire.encode({"message_type": "LookupActor", "actor_name": "pong"})
+        )
+
+        assert registry._heartbeats == {}
+
+
 class TestGlobalRegistryUnregister:
     """Tests for unregistering actors on timeout."""
 
@@ -103,7 +261,7 @@ class TestHeartbeatTimeout:
         # Register an actor with stale heartbeat
         registry._registry["actor1"] = ActorEntry("tcp://host:5001", "mgr1")
         registry._manager_actors["mgr1"] = {"actor1"}
-        registry._heartbeats["mgr1"] = time.monotonic() - 10  # 10s ago
+        registry._record_heartbeat("mgr1", time.monotonic() - 10)  # 10s ago
 
         registry._check_heartbeats()
 
@@ -117,13 +275,107 @@ class TestHeartbeatTimeout:
         # Register an actor with recent heartbeat
         registry._registry["actor1"] = ActorEntry("tcp://host:5001", "mgr1")
         registry._manager_actors["mgr1"] = {"actor1"}
-        registry._heartbeats["mgr1"] = time.monotonic()
+        registry._record_heartbeat("mgr1", time.monotonic())
 
         registry._check_heartbeats()
 
         assert "actor1" in registry._registry
         assert "mgr1" in registry._heartbeats
 
+    def test_check_heartbeats_ignores_superseded_entries(self):
+        """A stale heap entry is skipped once a newer heartbeat arrived."""
+        registry = GlobalRegistry()
+
+        registry._registry["actor1"] = ActorEntry("tcp://host:5001", "mgr1")
+        registry._manager_actors["mgr1"] = {"actor1"}
+        registry._record_heartbeat("mgr1", time.monotonic() - 10)
+        registry._record_heartbeat("mgr1", time.monotonic())
+
+        registry._check_heartbeats()
+
+        assert "actor1" in registry._registry
+        assert len(registry._hb_heap) == 1
+
+    def test_check_heartbeats_after_batch_heartbeat(self):
+        """A BatchHeartbeat keeps exactly the listed managers alive."""
+        registry = GlobalRegistry()
+
+        for mgr, actor in (("mgr1", "actor1"), ("mgr2", "actor2")):
+            registry._registry[actor] = ActorEntry("tcp://host:5001", mgr)
+            registry._manager_actors[mgr] = {actor}
+            registry._record_heartbeat(mgr, time.monotonic() - 10)
+        request = wire.encode(
+            {"message_type": "BatchHeartbeat", "manager_ids": ["mgr1"]},
+            binary=False
+        )
+        _process_request(registry, request)
+
+        registry._check_heartbeats()
+
+        assert "actor1" in registry._registry
+        assert "actor2" not in registry._registry
+        assert "mgr2" not in registry._heartbeats
+
+
+class TestManagerControl:
+    """Tests for SSH-based manager control."""
+
+    def test_start_manager_replies_from_actor_thread(self):
+        """The pool posts the status back; the actor thread sends the reply."""
+        class Ctx:
+            def __init__(self):
+                self.replies = []
+
+            def reply(self, msg):
+                self.replies.append((msg, threading.current_thread()))
+
+        registry = GlobalRegistry()
+        Manager().manage("GlobalRegistry", registry)
+        ctx = Ctx()
+        registry._on_start_manager(StartManager(manager_id="unknown"), ctx)
+
+        env = registry._queue.get(timeout=5.0)
+        assert ctx.replies == []
+        registry.process_message(env)
+
+        [(status, thread)] = ctx.replies
+        assert thread is threading.current_thread()
+        assert status.manager_id == "unknown"
+        assert status.running is False
+        assert "Unknown manager" in status.error
+        registry.end()
+
+
+class TestConfigLoading:
+    """Tests for loading host configuration."""
+
+    def test_load_config_maps_managers_to_hosts(self, tmp_path):
+        """Managers resolve to their host's ssh target and service name."""
+        config = tmp_path / "registry.json"
+        config.write_text(json.dumps({
+            "hosts": {
+                "host1": {
+                    "ssh": "actors@10.0.0.1",
+                    "managers": {
+                        "mgr1": {"service": "manager-one"},
+                        "mgr2": {},
+                    }
+                }
+            }
+        }))
+
+        registry = GlobalRegistry(config_path=str(config))
+
+        assert registry._host_ids == ["host1"]
+        assert registry._host_ssh[registry._manager_host["mgr1"]] == "actors@10.0.0.1"
+        assert registry._manager_service["mgr1"] == "manager-one"
+        assert registry._manager_service["mgr2"] == "mgr2"
+
+    def test_missing_config_is_ignored(self, tmp_path):
+        """A missing config file leaves the registry without hosts."""
+        registry = GlobalRegistry(config_path=str(tmp_path / "missing.json"))
+        assert registry._host_ids == []
+
 
 class TestGlobalRegistryLifecycle:
     """Tests for GlobalRegistry init/end lifecycle."""
@@ -139,6 +391,19 @@ class TestGlobalRegistryLifecycle:
 
         registry.end()
 
+    def test_monitor_expires_manager_at_deadline(self):
+        """The monitor wakes at the heartbeat deadline and unregisters."""
+        registry = GlobalRegistry()
+        registry.HEARTBEAT_TIMEOUT_S = 0.2
+        registry.init()
+
+        _do_register(registry, "mgr1", "pong", "tcp://host:5001", time.monotonic())
+        time.sleep(0.5)
+
+        assert registry.lookup("pong") is None
+        assert "mgr1" not in registry._heartbeats
+        registry.end()
+
     def test_end_stops_monitor_thread(self):
         """end() stops the heartbeat monitor thread."""
         registry = GlobalRegistry()
@@ -146,3 +411,4 @@ class TestGlobalRegistryLifecycle:
         registry.end()
 
         assert registry._running is False
+        assert not registry._monitor_thread.is_alive()
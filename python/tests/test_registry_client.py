@@ -0,0 +1,154 @@
+"""Tests for RegistryClient (without a running registry)."""
+
+import threading
+
+import pytest
+from actors import wire
+from actors.registry_client import (
+    RegistryClient, HeartbeatBatcher, ActorNotFoundError, ActorOfflineError
+)
+
+
+class FakeRegistryClient(RegistryClient):
+    """RegistryClient that answers requests from a canned reply list."""
+
+    def __init__(self, replies):
+        super().__init__("mgr1", "tcp://localhost:5555")
+        self.replies = list(replies)
+        self.requests = []
+
+    def _send_recv(self, msg):
+        self.requests.append(msg)
+        return self.replies.pop(0)
+
+
+def lookup_result(endpoint, online=True):
+    return {
+        "message_type": "LookupResult",
+        "actor_name": "pong",
+        "endpoint": endpoint,
+        "online": online,
+    }
+
+
+class TestLookupCache:
+    """Tests for the lookup cache."""
+
+    def test_repeat_lookup_served_from_cache(self):
+        """A second lookup within the TTL does not contact the registry."""
+        client = FakeRegistryClient([lookup_result("tcp://host:5001")])
+
+        assert client.lookup("pong") == "tcp://host:5001"
+        assert client.lookup("pong") == "tcp://host:5001"
+        assert len(client.requests) == 1
+
+    def test_expired_entry_is_refreshed(self):
+        """Entries older than the TTL are looked up again."""
+        client = FakeRegistryClient([
+            lookup_result("tcp://host:5001"),
+            lookup_result("tcp://host:6001"),
+        ])
+        client.LOOKUP_CACHE_TTL_S = 0.0
+
+        assert client.lookup("pong") == "tcp://host:5001"
+        assert client.lookup("pong") == "tcp://host:6001"
+        assert len(client.requests) == 2
+
+    def test_invalidate_forces_registry_lookup(self):
+        """invalidate() drops the cached endpoint for that actor."""
+        client = FakeRegistryClient([
+            lookup_result("tcp://host:5001"),
+            lookup_result("tcp://host:6001"),
+        ])
+
+        assert client.lookup("pong") == "tcp://host:5001"
+        client.invalidate("pong")
+        assert client.lookup("pong") == "tcp://host:6001"
+        assert len(client.requests) == 2
+
+    def test_errors_are_not_cached(self):
+        """Offline and not-found results raise and are not cached."""
+        client = FakeRegistryClient([
+            lookup_result("tcp://host:5001", online=False),
+            lookup_result(None, online=False),
+        ])
+
+        with pytest.raises(ActorOfflineError):
+            client.lookup("pong")
+        with pytest.raises(ActorNotFoundError):
+            client.lookup("pong")
+
+    def test_cache_evicts_least_recently_used(self):
+        """The cache holds at most LOOKUP_CACHE_SIZE entries."""
+        client = FakeRegistryClient([])
+        client.LOOKUP_CACHE_SIZE = 2
+
+        client._cache_put("a", "tcp://a")
+        client._cache_put("b", "tcp://b")
+        client._cache_get("a")
+        client._cache_put("c", "tcp://c")
+
+        assert list(client._lookup_cache) == ["a", "c"]
+
+
+class TestHeartbeatBatcher:
+    """Tests for HeartbeatBatcher payload caching."""
+
+    def test_payload_rebuilt_only_when_managers_change(self):
+        """The encoded BatchHeartbeat is reused until the manager set changes."""
+        batcher = HeartbeatBatcher("tcp://127.0.0.1:5599")
+        try:
+            batcher.add("mgr1")
+            first = batcher._heartbeat_payload()
+            assert wire.decode(first)["manager_ids"] == ["mgr1"]
+
+            # Another client for the same manager keeps the payload
+            batcher.add("mgr1")
+            assert batcher._heartbeat_payload() is first
+
+            batcher.add("mgr2")
+            assert wire.decode(batcher._heartbeat_payload())["manager_ids"] == ["mgr1", "mgr2"]
+        finally:
+            for manager_id in ("mgr1", "mgr1", "mgr2"):
+                batcher.remove(manager_id)
+
+        assert batcher._heartbeat_payload() is None
+
+    def test_add_while_stopping_does_not_revive_old_thread(self):
+        """An add() racing remove()'s join starts a fresh thread."""
+        batcher = HeartbeatBatcher("tcp://127.0.0.1:5599")
+        batcher.add("mgr1")
+        old_thread, old_stop = batcher._thread, batcher._stop
+        join = old_thread.join
+        # Simulate another client adding a manager after remove() has
+        # released the lock but before the old thread has seen the stop
+        old_thread.join = lambda timeout=None: batcher.add("mgr2")
+        try:
+            batcher.remove("mgr1")
+
+            assert old_stop.is_set()
+            join(3.0)
+            assert not old_thread.is_alive()
+            assert batcher._thread is not old_thread
+            assert batcher._thread.is_alive()
+        finally:
+            batcher.remove("mgr2")
+
+
+class TestOutboxSockets:
+    """Tests for the per-thread outbox sockets."""
+
+    def test_outbox_closed_when_thread_exits(self):
+        """Short-lived threads do not leave outbox sockets behind."""
+        client = RegistryClient("mgr1", "tcp://127.0.0.1:5945")
+        try:
+            sockets = []
+            for _ in range(20):
+                thread = threading.Thread(target=lambda: sockets.append(client._get_socket()))
+                thread.start()
+                thread.join()
+
+            assert all(socket.closed for socket in sockets)
+            assert client._outboxes == set()
+        finally:
+            client.close()
@@ -1,10 +1,14 @@
 """Tests for registry message dataclasses."""
 
+import dataclasses
+import json
+
 import pytest
 import time
 from actors.registry_messages import (
     RegisterActor, UnregisterActor, RegistrationOk, RegistrationFailed,
-    LookupActor, LookupResult, Heartbeat, HeartbeatAck
+    LookupActor, LookupResult, LookupManyActors, LookupManyResult,
+    Heartbeat, BatchHeartbeat, HeartbeatAck, HEARTBEAT_ACK, HEARTBEAT_ACK_BYTES
 )
 
 
@@ -25,6 +29,34 @@ class TestRegisterActor:
         assert result["actor_name"] == "pong"
         assert result["actor_endpoint"] == "tcp://localhost:5001"
 
+    def test_to_json_bytes_matches_to_dict(self):
+        """to_json_bytes() encodes the same fields as to_dict()."""
+        msg = RegisterActor("mgr1", "pong", "tcp://localhost:5001")
+
+        assert json.loads(msg.to_json_bytes()) == msg.to_dict()
+
+    def test_to_dict_key_order_follows_fields(self):
+        """to_dict() lists message_type, then fields in declaration order."""
+        msg = RegisterActor("mgr1", "pong", "tcp://localhost:5001")
+
+        assert list(msg.to_dict()) == [
+            "message_type", "manager_id", "actor_name", "actor_endpoint"
+        ]
+
+    def test_to_dict_returns_fresh_dict(self):
+        """Mutating one to_dict() result does not affect the next."""
+        msg = RegisterActor("mgr1", "pong", "tcp://localhost:5001")
+        msg.to_dict()["corr_id"] = 1
+
+        assert "corr_id" not in msg.to_dict()
+
+    def test_is_frozen(self):
+        """Messages are immutable once constructed."""
+        msg = RegisterActor("mgr1", "pong", "tcp://localhost:5001")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            msg.actor_name = "ping"
+
 
 class TestUnregisterActor:
     """Tests for UnregisterActor message."""
@@ -95,6 +127,24 @@ class TestLookupResult:
         assert result["online"] is False
 
 
+class TestLookupMany:
+    """Tests for LookupManyActors / LookupManyResult messages."""
+
+    def test_request_to_dict(self):
+        msg = LookupManyActors(actor_names=["ping", "pong"])
+        result = msg.to_dict()
+
+        assert result["message_type"] == "LookupManyActors"
+        assert result["actor_names"] == ["ping", "pong"]
+
+    def test_result_to_dict(self):
+        msg = LookupManyResult(results={"pong": ("tcp://localhost:5001", True)})
+        result = msg.to_dict()
+
+        assert result["message_type"] == "LookupManyResult"
+        assert result["results"]["pong"] == ("tcp://localhost:5001", True)
+
+
 class TestHeartbeat:
     """Tests for Heartbeat message."""
 
@@ -106,7 +156,7 @@ class TestHeartbeat:
         assert result["manager_id"] == "mgr1"
         assert "timestamp_ms" in result
         # Timestamp should be recent (within last second)
-        now_ms = int(time.time() * 1000)
+        now_ms = time.time_ns() // 1_000_000
         assert abs(result["timestamp_ms"] - now_ms) < 1000
 
     def test_custom_timestamp(self):
@@ -116,6 +166,17 @@ class TestHeartbeat:
         assert result["timestamp_ms"] == 12345
 
 
+class TestBatchHeartbeat:
+    """Tests for BatchHeartbeat message."""
+
+    def test_to_dict(self):
+        msg = BatchHeartbeat(manager_ids=["mgr1", "mgr2"])
+        result = msg.to_dict()
+
+        assert result["message_type"] == "BatchHeartbeat"
+        assert result["manager_ids"] == ["mgr1", "mgr2"]
+
+
 class TestHeartbeatAck:
     """Tests for HeartbeatAck message."""
 
@@ -124,3 +185,8 @@ class TestHeartbeatAck:
         result = msg.to_dict()
 
         assert result["message_type"] == "HeartbeatAck"
+
+    def test_is_shared_instance(self):
+        """HeartbeatAck() returns the module-level HEARTBEAT_ACK."""
+        assert HeartbeatAck() is HEARTBEAT_ACK
+        assert json.loads(HEARTBEAT_ACK_BYTES) == {"message_type": "HeartbeatAck"}
@@ -0,0 +1,284 @@
+"""Tests for ZmqSender (without a remote peer)."""
+
+import threading
+import time
+
+import pytest
+import zmq
+from actors import wire
+from actors.actor import Actor
+from actors.manager import Manager
+from actors.remote import ZmqReceiver, ZmqSender, _Endpoint
+from actors.serialization import register_message
+
+
+class FakeSocket:
+    """PUSH socket stand-in that refuses non-blocking sends while full."""
+
+    def __init__(self):
+        self.full = False
+        self.sent = []
+
+    def send_multipart(self, frames, flags=0):
+        if self.full and flags & zmq.NOBLOCK:
+            raise zmq.Again()
+        self.sent.append(frames)
+
+    def close(self):
+        pass
+
+
+class Ping:
+    def __init__(self, count):
+        self.count = count
+
+
+def sent_counts(socket):
+    return [wire.decode(frames[0])["message"]["count"] for frames in socket.sent]
+
+
+def install(sender, endpoint, socket):
+    """Put a socket in the sender's cache for endpoint."""
+    sender._endpoints[endpoint] = _Endpoint(socket)
+    return socket
+
+
+def hwm_context():
+    """Context whose sockets queue at most one message per direction."""
+    context = zmq.Context()
+    context.setsockopt(zmq.SNDHWM, 1)
+    context.setsockopt(zmq.RCVHWM, 1)
+    context.setsockopt(zmq.LINGER, 0)
+    return context
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+class TestSendBacklog:
+    """Tests for the non-blocking send path and its backlog."""
+
+    def test_full_socket_backlogs_and_drains_in_order(self):
+        """Messages refused by ZMQ are delivered later, in send order."""
+        context = hwm_context()
+        sender = ZmqSender(context=context)
+        pull = context.socket(zmq.PULL)
+        try:
+            for count in range(5):
+                sender.send_to("inproc://pong", "pong", Ping(count), None)
+            assert sender.pending() > 0
+
+            pull.bind("inproc://pong")
+            received = [wire.decode(pull.recv_multipart()[0])["message"]["count"]
+                        for _ in range(5)]
+
+            assert received == [0, 1, 2, 3, 4]
+            assert wait_for(lambda: sender._drain_thread is None)
+            assert sender.pending() == 0
+        finally:
+            sender.close()
+            pull.close()
+            context.term()
+
+    def test_full_backlog_only_blocks_its_own_endpoint(self):
+        """A dead peer's full backlog stalls its senders, nobody else."""
+        context = hwm_context()
+        sender = ZmqSender(context=context)
+        sender.SEND_BACKLOG_SIZE = 2
+        pull = context.socket(zmq.PULL)
+        pull.bind("inproc://live")
+        try:
+            for count in range(10):
+                if sender.pending() == 2:
+                    break
+                sender.send_to("inproc://dead", "pong", Ping(count), None)
+            assert sender.pending() == 2
+            blocked = threading.Thread(
+                target=sender.send_to,
+                args=("inproc://dead", "pong", Ping(99), None),
+                daemon=True
+            )
+            blocked.start()
+            time.sleep(0.05)
+            assert blocked.is_alive()
+
+            sender.send_to("inproc://live", "pong", Ping(7), None)
+            assert wire.decode(pull.recv_multipart()[0])["message"]["count"] == 7
+
+            sender.disconnect("inproc://dead")
+            blocked.join(1.0)
+            assert not blocked.is_alive()
+            assert wait_for(lambda: sender._drain_thread is None)
+        finally:
+            sender.close()
+            pull.close()
+            context.term()
+
+
+class TestPackedBatch:
+    """Tests for single-frame packing of same-typed batches."""
+
+    @pytest.mark.skipif(not wire.HAVE_MSGPACK, reason="msgpack not installed")
+    def test_binary_batch_of_one_type_is_one_frame(self):
+        """A homogeneous binary batch is sent as a single packed frame."""
+        sender = ZmqSender(binary=True)
+        socket = install(sender, "tcp://peer:1", FakeSocket())
+
+        sender.send_batch("tcp://peer:1", "pong", [Ping(1), Ping(2)], None)
+
+        [frames] = socket.sent
+        assert len(frames) == 1
+        data = wire.decode(frames[0])
+        assert data["message_type"] == "Ping"
+        assert data["messages"] == [{"count": 1}, {"count": 2}]
+
+    def test_json_batch_keeps_one_frame_per_message(self):
+        """JSON batches stay readable by C++ receivers."""
+        sender = ZmqSender()
+        socket = install(sender, "tcp://peer:1", FakeSocket())
+
+        sender.send_batch("tcp://peer:1", "pong", [Ping(1), Ping(2)], None)
+
+        [frames] = socket.sent
+        assert [wire.decode(frame)["message"]["count"] for frame in frames] == [1, 2]
+
+    def test_receiver_delivers_packed_batch_in_order(self):
+        """Every body of a packed batch reaches the actor in order."""
+        register_message(Ping)
+        manager = Manager()
+        actor = Actor()
+        manager.manage("pong", actor)
+        receiver = ZmqReceiver("tcp://127.0.0.1:5944", manager, ZmqSender())
+
+        receiver._handle_remote_message({
+            "sender_actor": None,
+            "sender_endpoint": None,
+            "receiver": "pong",
+            "message_type": "Ping",
+            "messages": [{"count": 1}, {"count": 2}],
+        })
+
+        assert [actor._queue.get_nowait().msg.count for _ in range(2)] == [1, 2]
+
+
+class TestSocketCache:
+    """Tests for the per-endpoint PUSH socket cache."""
+
+    def test_socket_reused_per_endpoint(self):
+        """Repeated sends to an endpoint share one connected socket."""
+        sender = ZmqSender()
+        try:
+            first = sender._get_endpoint("tcp://127.0.0.1:5941").socket
+            assert sender._get_endpoint("tcp://127.0.0.1:5941").socket is first
+        finally:
+            sender.close()
+
+    def test_disconnect_drops_socket_and_backlog(self):
+        """disconnect() closes the endpoint's socket and forgets its backlog."""
+        context = hwm_context()
+        sender = ZmqSender(context=context)
+        try:
+            for count in range(3):
+                sender.send_to("inproc://pong", "pong", Ping(count), None)
+            assert sender.pending() > 0
+
+            sender.disconnect("inproc://pong")
+
+            assert "inproc://pong" not in sender._endpoints
+            assert sender.pending() == 0
+            assert wait_for(lambda: sender._drain_thread is None)
+        finally:
+            sender.close()
+            context.term()
+
+
+class TestLocalShortcut:
+    """Tests for delivery to actors in the sender's own process."""
+
+    def test_send_to_own_endpoint_uses_mailbox(self):
+        """Messages for local_endpoint go straight to the local actor."""
+        manager = Manager()
+        actor = Actor()
+        manager.manage("pong", actor)
+        sender = ZmqSender(local_endpoint="tcp://localhost:5001")
+        sender.set_local_manager(manager)
+        msg = Ping(1)
+
+        sender.send_to("tcp://localhost:5001", "pong", msg, None)
+
+        assert actor._queue.get_nowait().msg is msg
+        assert sender._endpoints == {}
+
+    def test_unknown_local_actor_goes_over_zmq(self):
+        """Names the manager does not know still go through the socket."""
+        manager = Manager()
+        sender = ZmqSender(local_endpoint="tcp://localhost:5001")
+        sender.set_local_manager(manager)
+        socket = install(sender, "tcp://localhost:5001", FakeSocket())
+
+        sender.send_to("tcp://localhost:5001", "missing", Ping(1), None)
+
+        assert sent_counts(socket) == [1]
+
+
+class TestReceiverContext:
+    """Tests for ZMQ context sharing between sender and receiver."""
+
+    def test_receiver_defaults_to_sender_context(self):
+        """A receiver binds on the same context its sender connects from."""
+        context = zmq.Context()
+        try:
+            sender = ZmqSender(context=context)
+            receiver = ZmqReceiver("tcp://127.0.0.1:5942", Manager(), sender)
+            assert receiver._context is context
+        finally:
+            context.term()
+
+
+class FakePullSocket:
+    """PULL socket stand-in serving a fixed list of queued messages."""
+
+    def __init__(self, messages):
+        self.messages = list(messages)
+
+    def recv_multipart(self, flags=0):
+        if not self.messages:
+            raise zmq.Again()
+        return self.messages.pop(0)
+
+
+class TestReceiverDrain:
+    """Tests for ZmqReceiver's per-wakeup receive loop."""
+
+    def make_receiver(self, messages):
+        handled = []
+        receiver = ZmqReceiver("tcp://127.0.0.1:5943", Manager(), ZmqSender())
+        receiver._zmq_socket = FakePullSocket(messages)
+        receiver._handle_remote_message = handled.append
+        return receiver, handled
+
+    def test_drains_all_queued_messages(self):
+        """One wakeup handles every queued message, including batches."""
+        frames = [[wire.encode({"n": 1}, binary=False)],
+                  [wire.encode({"n": 2}, binary=False),
+                   wire.encode({"n": 3}, binary=False)]]
+        receiver, handled = self.make_receiver(frames)
+
+        receiver._drain_socket()
+
+        assert [data["n"] for data in handled] == [1, 2, 3]
+
+    def test_stops_at_recv_batch_size(self):
+        """Draining yields after RECV_BATCH_SIZE messages."""
+        frames = [[wire.encode({"n": n}, binary=False)] for n in range(5)]
+        receiver, handled = self.make_receiver(frames)
+        receiver.RECV_BATCH_SIZE = 3
+
+        receiver._drain_socket()
+
+        assert len(handled) == 3
+        assert len(receiver._zmq_socket.messages) == 2
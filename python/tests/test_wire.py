@@ -0,0 +1,32 @@
+"""Tests for registry wire codecs."""
+
+import json
+
+import pytest
+from actors import wire
+
+
+class TestWireCodec:
+    """Tests for encode/decode format handling."""
+
+    def test_json_round_trip(self):
+        """JSON encoding round-trips and is detected as JSON."""
+        msg = {"message_type": "LookupActor", "actor_name": "pong"}
+        data = wire.encode(msg, binary=False)
+
+        assert wire.is_json(data)
+        assert wire.decode_with_format(data) == (msg, False)
+
+    def test_decodes_plain_json_from_other_languages(self):
+        """Compact JSON from C++/Rust clients is decoded."""
+        data = json.dumps({"message_type": "Heartbeat", "manager_id": "m"}).encode()
+        assert wire.decode(data)["manager_id"] == "m"
+
+    @pytest.mark.skipif(not wire.HAVE_MSGPACK, reason="msgpack not installed")
+    def test_msgpack_round_trip(self):
+        """msgpack encoding round-trips and is detected as binary."""
+        msg = {"message_type": "LookupResult", "endpoint": None, "online": False}
+        data = wire.encode(msg, binary=True)
+
+        assert not wire.is_json(data)
+        assert wire.decode_with_format(data) == (msg, True)
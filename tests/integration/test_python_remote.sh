@@ -6,6 +6,10 @@ set -e
 SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
 ACTORS_DIR="$(cd "$SCRIPT_DIR/../.." && pwd)"
 PYTHON_DIR="$ACTORS_DIR/python"
+# The examples import the actors package from the path
+export PYTHONPATH="$PYTHON_DIR${PYTHONPATH:+:$PYTHONPATH}"
+# The asserts below check the per-message lines
+export ACTORS_VERBOSE=1
 
 echo "=== Testing Python remote ping-pong ==="
 